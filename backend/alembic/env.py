@@ -5,6 +5,16 @@ from sqlalchemy import engine_from_config, pool
 from alembic import context
 from app.config import settings
 from app.database import Base
+from app.models.dedup import DocumentFingerprint, DocumentLshBucket  # noqa: F401
+from app.models.document import (  # noqa: F401
+    Document,
+    DocumentFile,
+    DocumentNote,
+    DocumentTag,
+)
+from app.models.purge import PurgeJob  # noqa: F401
+from app.models.tag import Tag  # noqa: F401
+from app.models.upload import UploadSession, UploadSessionFile  # noqa: F401
 from app.models.user import User, UserProfile  # noqa: F401
 
 # this is the Alembic Config object, which provides
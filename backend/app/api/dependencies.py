@@ -1,18 +1,130 @@
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from datetime import timedelta
+from pathlib import Path
 from typing import Annotated
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import settings
+from app.database import SessionLocal, get_db
+from app.services.dedup_service import DedupService
+from app.services.document_service import DocumentService
+from app.services.export_service import ExportService
+from app.services.purge_service import PurgeService
+from app.services.tag_service import TagService
+from app.services.upload_service import UploadService
 from app.services.user_service import UserService
 
 # --- DB
 db_dep = Annotated[Session, Depends(get_db)]
 
 
+def get_session_factory() -> Callable[[], AbstractContextManager[Session]]:
+    return SessionLocal
+
+
+session_factory_dep = Annotated[
+    Callable[[], AbstractContextManager[Session]], Depends(get_session_factory)
+]
+
+
+# --- Storage
+def get_storage_dir() -> Path:
+    return Path(settings.storage_dir)
+
+
+storage_dep = Annotated[Path, Depends(get_storage_dir)]
+
+
 # --- User service
 def get_user_service(session: db_dep) -> UserService:
     return UserService(session)
 
 
 user_svc_dep = Annotated[UserService, Depends(get_user_service)]
+
+
+# --- Document service
+def get_document_service(session: db_dep) -> DocumentService:
+    return DocumentService(session)
+
+
+document_svc_dep = Annotated[DocumentService, Depends(get_document_service)]
+
+
+# --- Upload service
+def get_upload_service(session: db_dep, storage_dir: storage_dep) -> UploadService:
+    return UploadService(
+        session,
+        storage_dir,
+        session_ttl=timedelta(hours=settings.upload_session_ttl_hours),
+    )
+
+
+upload_svc_dep = Annotated[UploadService, Depends(get_upload_service)]
+
+
+# --- Export service
+def get_export_service(session: db_dep, storage_dir: storage_dep) -> ExportService:
+    return ExportService(session, storage_dir)
+
+
+export_svc_dep = Annotated[ExportService, Depends(get_export_service)]
+
+
+# --- Tag service
+def get_tag_service(session: db_dep, storage_dir: storage_dep) -> TagService:
+    return TagService(session, storage_dir)
+
+
+tag_svc_dep = Annotated[TagService, Depends(get_tag_service)]
+
+
+# --- Dedup service
+def get_dedup_service(session: db_dep, storage_dir: storage_dep) -> DedupService:
+    return DedupService(session, storage_dir)
+
+
+dedup_svc_dep = Annotated[DedupService, Depends(get_dedup_service)]
+
+
+# --- Purge service
+def get_purge_service(session: db_dep, storage_dir: storage_dep) -> PurgeService:
+    return PurgeService(session, storage_dir, batch_size=settings.purge_batch_size)
+
+
+purge_svc_dep = Annotated[PurgeService, Depends(get_purge_service)]
+
+
+# Purges run on a thread of their own: as a background task they would keep
+# the request, and its admission slot, open until the purge finished. Jobs
+# left unfinished by a restart are picked up by scripts/resume_purge_jobs.
+purge_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="purge")
+
+
+def get_purge_executor() -> Executor:
+    return purge_executor
+
+
+def get_purge_runner(
+    session_factory: session_factory_dep,
+    storage_dir: storage_dep,
+    executor: Annotated[Executor, Depends(get_purge_executor)],
+) -> Callable[[int], None]:
+    # Jobs run after the request session is closed, so each opens its own.
+    def run(job_id: int) -> None:
+        with session_factory() as session:
+            PurgeService(
+                session, storage_dir, batch_size=settings.purge_batch_size
+            ).run(job_id)
+
+    def submit(job_id: int) -> None:
+        executor.submit(run, job_id)
+
+    return submit
+
+
+purge_runner_dep = Annotated[Callable[[int], None], Depends(get_purge_runner)]
@@ -0,0 +1,116 @@
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError, NoResultFound
+
+from app.api.dependencies import (
+    dedup_svc_dep,
+    document_svc_dep,
+    purge_runner_dep,
+    purge_svc_dep,
+    tag_svc_dep,
+)
+from app.schemas.document import DocumentMerge, DocumentRead, DuplicateRead
+from app.schemas.purge import PurgeJobRead
+from app.schemas.tag import DocumentTagCreate, DocumentTagRead, TagSuggestion
+
+router = APIRouter(
+    prefix="/v1/documents",
+    tags=["documents"],
+)
+
+
+@router.get("/{document_id}", response_model=DocumentRead)
+def get_document(document_id: int, service: document_svc_dep):
+    try:
+        return service.get_document(document_id)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Document not found") from None
+
+
+@router.delete(
+    "/{document_id}",
+    response_model=PurgeJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def delete_document(
+    document_id: int,
+    service: document_svc_dep,
+    purge_service: purge_svc_dep,
+    run_purge: purge_runner_dep,
+):
+    try:
+        service.delete_document(document_id)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Document not found") from None
+
+    job = purge_service.create_job("document", document_id)
+    run_purge(job.id)
+    return job
+
+
+@router.post("/{document_id}/tags", response_model=DocumentTagRead, status_code=201)
+def assign_tag(document_id: int, tag: DocumentTagCreate, service: tag_svc_dep):
+    try:
+        return service.assign_tag(
+            document_id,
+            user_id=tag.user_id,
+            name=tag.name,
+            color=tag.color,
+        )
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Document not found") from None
+    except IntegrityError as ieex:
+        print(ieex)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Tag already assigned to this document",
+        ) from None
+
+
+@router.get("/{document_id}/tag-suggestions", response_model=list[TagSuggestion])
+def suggest_tags(
+    document_id: int,
+    user_id: int,
+    service: tag_svc_dep,
+    limit: Annotated[int, Query(ge=1, le=50)] = 5,
+):
+    try:
+        suggestions = service.suggest_tags(document_id, user_id=user_id, limit=limit)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Document not found") from None
+
+    return [TagSuggestion(tag=tag, score=score) for tag, score in suggestions]
+
+
+@router.get("/{document_id}/duplicates", response_model=list[DuplicateRead])
+def list_duplicates(document_id: int, service: dedup_svc_dep):
+    try:
+        duplicates = service.find_duplicates(document_id)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Document not found") from None
+
+    return [
+        DuplicateRead(
+            document_id=duplicate.id, title=duplicate.title, similarity=similarity
+        )
+        for duplicate, similarity in duplicates
+    ]
+
+
+@router.post("/{document_id}/merge", response_model=DocumentRead)
+def merge_documents(document_id: int, merge: DocumentMerge, service: dedup_svc_dep):
+    try:
+        return service.merge_documents(document_id, merge.source_document_id)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Document not found") from None
+    except ValueError as vex:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(vex)
+        ) from None
@@ -0,0 +1,43 @@
+import re
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import NoResultFound
+
+from app.api.dependencies import export_svc_dep
+
+router = APIRouter(
+    prefix="/v1/exports",
+    tags=["exports"],
+)
+
+
+def zip_response(archive, filename: str) -> StreamingResponse:
+    safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", filename)
+    return StreamingResponse(
+        archive,
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{safe_name}"'},
+    )
+
+
+@router.get("/documents/{document_id}")
+def export_document(document_id: int, service: export_svc_dep):
+    try:
+        archive = service.document_archive(document_id)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Document not found") from None
+
+    return zip_response(archive, f"document-{document_id}.zip")
+
+
+@router.get("/tags/{tag_name}")
+def export_tag(tag_name: str, user_id: int, service: export_svc_dep):
+    try:
+        archive = service.tag_archive(user_id, tag_name)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Tag not found") from None
+
+    return zip_response(archive, f"{tag_name}.zip")
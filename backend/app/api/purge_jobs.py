@@ -0,0 +1,19 @@
+from fastapi import APIRouter, HTTPException
+from sqlalchemy.exc import NoResultFound
+
+from app.api.dependencies import purge_svc_dep
+from app.schemas.purge import PurgeJobRead
+
+router = APIRouter(
+    prefix="/v1/purge-jobs",
+    tags=["purge-jobs"],
+)
+
+
+@router.get("/{job_id}", response_model=PurgeJobRead)
+def get_purge_job(job_id: int, service: purge_svc_dep):
+    try:
+        return service.get_job(job_id)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Purge job not found") from None
@@ -0,0 +1,174 @@
+from collections.abc import Iterator
+from typing import Annotated
+
+import anyio.from_thread
+from fastapi import APIRouter, Header, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import NoResultFound
+
+from app.api.dependencies import dedup_svc_dep, upload_svc_dep
+from app.config import settings
+from app.schemas.document import DocumentRead, DocumentUploadRead, DuplicateRead
+from app.schemas.upload import (
+    UploadSessionCreate,
+    UploadSessionFileRead,
+    UploadSessionRead,
+)
+from app.services.upload_service import (
+    UploadChecksumError,
+    UploadIncompleteError,
+    UploadLengthMismatchError,
+    UploadOffsetMismatchError,
+    UploadSizeExceededError,
+)
+
+router = APIRouter(
+    prefix="/v1/uploads",
+    tags=["uploads"],
+)
+
+
+@router.post("/", response_model=UploadSessionRead, status_code=201)
+def create_upload(upload: UploadSessionCreate, service: upload_svc_dep):
+    try:
+        return service.create_session(
+            user_id=upload.user_id,
+            files=[(file.filename, file.size) for file in upload.files],
+            title=upload.title,
+            description=upload.description,
+        )
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="User not found") from None
+    except ValueError as vex:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(vex)
+        ) from None
+
+
+@router.get("/{session_id}", response_model=UploadSessionRead)
+def get_upload(session_id: str, service: upload_svc_dep):
+    try:
+        return service.get_session(session_id)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Upload not found") from None
+
+
+def iter_body(request: Request) -> Iterator[bytes]:
+    """Read the request body from a worker thread, one part at a time."""
+    stream = request.stream()
+    while True:
+        try:
+            part = anyio.from_thread.run(stream.__anext__)
+        except StopAsyncIteration:
+            return
+        if part:
+            yield part
+
+
+@router.patch(
+    "/{session_id}/files/{file_id}",
+    response_model=UploadSessionFileRead,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/offset+octet-stream": {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            },
+        }
+    },
+)
+async def upload_chunk(
+    session_id: str,
+    file_id: int,
+    request: Request,
+    upload_offset: Annotated[int, Header()],
+    service: upload_svc_dep,
+    response: Response,
+    content_length: Annotated[int | None, Header()] = None,
+    upload_checksum: Annotated[str | None, Header()] = None,
+):
+    # The body is streamed straight into the staging file, so its size has
+    # to be known, and bounded, before reading it.
+    if content_length is None:
+        raise HTTPException(
+            status_code=status.HTTP_411_LENGTH_REQUIRED,
+            detail="Content-Length is required",
+        )
+    if content_length > settings.upload_max_chunk_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail="Chunk is too large",
+        )
+
+    try:
+        upload_file = await run_in_threadpool(
+            service.append_chunk,
+            session_id,
+            file_id,
+            offset=upload_offset,
+            data=iter_body(request),
+            length=content_length,
+            checksum=upload_checksum,
+        )
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Upload not found") from None
+    except UploadOffsetMismatchError as omex:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(omex)
+        ) from None
+    except UploadSizeExceededError as seex:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(seex)
+        ) from None
+    except (UploadChecksumError, UploadLengthMismatchError) as cex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(cex)
+        ) from None
+
+    response.headers["Upload-Offset"] = str(upload_file.offset)
+    return upload_file
+
+
+@router.post(
+    "/{session_id}/finalize", response_model=DocumentUploadRead, status_code=201
+)
+def finalize_upload(
+    session_id: str, service: upload_svc_dep, dedup_service: dedup_svc_dep
+):
+    try:
+        document = service.finalize(session_id)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Upload not found") from None
+    except UploadIncompleteError as iex:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(iex)
+        ) from None
+
+    dedup_service.index_document(document.id)
+    duplicates = dedup_service.find_duplicates(document.id)
+    return DocumentUploadRead(
+        **DocumentRead.model_validate(document).model_dump(),
+        possible_duplicates=[
+            DuplicateRead(
+                document_id=duplicate.id,
+                title=duplicate.title,
+                similarity=similarity,
+            )
+            for duplicate, similarity in duplicates
+        ],
+    )
+
+
+@router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+def abort_upload(session_id: str, service: upload_svc_dep):
+    try:
+        service.abort(session_id)
+    except NoResultFound as nrfex:
+        print(nrfex)
+        raise HTTPException(status_code=404, detail="Upload not found") from None
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException, status
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
-from app.api.dependencies import user_svc_dep
+from app.api.dependencies import purge_runner_dep, purge_svc_dep, user_svc_dep
+from app.schemas.purge import PurgeJobRead
 from app.schemas.user import UserCreate, UserRead, UserUpdate
 
 router = APIRouter(
@@ -59,10 +60,21 @@ def update_user(user_id: int, user: UserUpdate, service: user_svc_dep):
         ) from None
 
 
-@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(user_id: int, service: user_svc_dep):
+@router.delete(
+    "/{user_id}", response_model=PurgeJobRead, status_code=status.HTTP_202_ACCEPTED
+)
+def delete_user(
+    user_id: int,
+    service: user_svc_dep,
+    purge_service: purge_svc_dep,
+    run_purge: purge_runner_dep,
+):
     try:
         service.delete_user(user_id)
     except NoResultFound as nrfex:
         print(nrfex)
         raise HTTPException(status_code=404, detail="User not found") from None
+
+    job = purge_service.create_job("user", user_id)
+    run_purge(job.id)
+    return job
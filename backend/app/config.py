@@ -7,8 +7,42 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file="../.env")
 
     database_url: str
+    # Read replicas, as a JSON list of URLs. Read-only service methods are
+    # spread over them in round-robin order.
+    database_replica_urls: list[str] = []
     debug: bool = False
     timezone: str = "UTC"
+    storage_dir: str = "storage"
+
+    # --- Rate limiting and admission control
+    rate_limit_enabled: bool = True
+    rate_limit_per_minute: int = 600
+    rate_limit_burst: int = 100
+    admission_max_in_flight_read: int = 64
+    admission_max_in_flight_write: int = 16
+    # Chunk uploads and ZIP exports hold a slot for as long as the transfer
+    # lasts, so they get classes of their own.
+    admission_max_in_flight_upload: int = 8
+    admission_max_in_flight_export: int = 4
+    admission_pool_wait_threshold_ms: float = 250.0
+
+    # --- Response compression
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_level: int = 4
+    compression_zstd_level: int = 3
+    # Streamed responses are flushed once this much input is buffered, or
+    # after this many seconds, whichever comes first.
+    compression_flush_size: int = 16 * 1024
+    compression_flush_interval: float = 0.1
+
+    # --- Resumable uploads
+    upload_max_chunk_size: int = 8 * 1024 * 1024
+    upload_session_ttl_hours: int = 24
+
+    # --- Purge of soft-deleted users and documents
+    purge_batch_size: int = 500
+    purge_stale_after_minutes: int = 10
 
     @property
     def tz(self) -> ZoneInfo:
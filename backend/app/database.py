@@ -1,18 +1,176 @@
-from collections.abc import Generator
+import functools
+import itertools
+import threading
+import time
+from collections.abc import Callable, Generator, Iterator, Sequence
+from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import PoolProxiedConnection, QueuePool
 
 from app.config import settings
 
-engine = create_engine(settings.database_url, echo=settings.debug)
 
-SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+class ReplicaPool:
+    """Hand out read replica engines in round-robin order."""
+
+    def __init__(self, engines: Sequence[Engine]):
+        self._engines = list(engines)
+        self._cycle = itertools.cycle(self._engines)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def next(self) -> Engine:
+        """Return the next replica engine.
+
+        Raises:
+            LookupError: If the pool has no replicas.
+        """
+        if not self._engines:
+            raise LookupError("No read replicas configured")
+        with self._lock:
+            return next(self._cycle)
+
+
+class RoutingSession(Session):
+    """Session that sends reads inside ``read_only()`` to a read replica.
+
+    A session picks one replica the first time it reads and keeps it, so a
+    request never sees data go back in time. Once the session writes
+    anything (a flush or an INSERT/UPDATE/DELETE statement) every later
+    read goes to the primary as well, so a request always reads its own
+    writes even if the replicas lag behind.
+
+    Only statements run inside ``read_only()`` go to the replica; a lazy
+    load triggered afterwards runs on the primary. Read-only methods must
+    therefore eager-load whatever their callers use.
+    """
+
+    def __init__(self, *, replicas: ReplicaPool | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self._replicas = replicas
+        self._replica: Engine | None = None
+        self._read_only_depth = 0
+        self._wrote = False
+
+    @contextmanager
+    def read_only(self) -> Iterator[None]:
+        """Allow the statements run in this block to go to a replica."""
+        self._read_only_depth += 1
+        try:
+            yield
+        finally:
+            self._read_only_depth -= 1
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or getattr(clause, "is_dml", False):
+            self._wrote = True
+        elif self._read_only_depth and not self._wrote and self._replicas:
+            if self._replica is None:
+                self._replica = self._replicas.next()
+            return self._replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def read_only(method: Callable) -> Callable:
+    """Run a service method on a read replica when one is available.
+
+    The service must keep its session in ``self._db``. Sessions other than
+    ``RoutingSession`` always use their own bind.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not isinstance(self._db, RoutingSession):
+            return method(self, *args, **kwargs)
+        with self._db.read_only():
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Base(DeclarativeBase): ...
 
 
+class PoolWaitMonitor:
+    """Track how long requests wait to check a connection out of the pool.
+
+    Keeps an exponentially weighted moving average of the observed waits. The
+    average decays with time since the last sample, so a pool that stops
+    being used (e.g. because load is being shed) is not considered saturated
+    forever.
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: float = 0.2,
+        half_life: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._alpha = alpha
+        self._half_life = half_life
+        self._clock = clock
+        self._average = 0.0
+        self._last_sample: float | None = None
+        self._lock = threading.Lock()
+
+    def record(self, wait: float) -> None:
+        """Record a single pool checkout wait, in seconds."""
+        with self._lock:
+            self._average = self._decayed() * (1 - self._alpha) + wait * self._alpha
+            self._last_sample = self._clock()
+
+    def current(self) -> float:
+        """Return the current (decayed) average wait, in seconds."""
+        with self._lock:
+            return self._decayed()
+
+    def _decayed(self) -> float:
+        if self._last_sample is None:
+            return 0.0
+        elapsed = self._clock() - self._last_sample
+        return self._average * 0.5 ** (elapsed / self._half_life)
+
+
+pool_wait_monitor = PoolWaitMonitor()
+
+
+class MonitoredQueuePool(QueuePool):
+    """Queue pool that reports how long each checkout took to ``monitor``.
+
+    Only checkouts that actually happen are measured, so a request that never
+    touches the primary (e.g. one served from a replica) does not hold one of
+    its connections just to sample the wait.
+    """
+
+    monitor: PoolWaitMonitor = pool_wait_monitor
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        connection = super().connect()
+        self.monitor.record(time.perf_counter() - start)
+        return connection
+
+
+engine = create_engine(
+    settings.database_url, echo=settings.debug, poolclass=MonitoredQueuePool
+)
+replica_pool = ReplicaPool(
+    [create_engine(url, echo=settings.debug) for url in settings.database_replica_urls]
+)
+
+SessionLocal = sessionmaker(
+    bind=engine,
+    class_=RoutingSession,
+    replicas=replica_pool,
+    expire_on_commit=False,
+)
+
+
 def get_db() -> Generator[Session]:
     with SessionLocal() as session:
         yield session
@@ -1,12 +1,68 @@
 from fastapi import FastAPI
 
+from app.api.documents import router as documents_router
+from app.api.exports import router as exports_router
 from app.api.health import router as health_router
+from app.api.purge_jobs import router as purge_jobs_router
+from app.api.uploads import router as uploads_router
 from app.api.users import router as users_router
+from app.config import settings
+from app.database import pool_wait_monitor
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.rate_limit import (
+    AdmissionController,
+    InMemoryRateLimitBackend,
+    RateLimitMiddleware,
+    path_classifier,
+)
+
+rate_limit_backend = InMemoryRateLimitBackend()
 
 app = FastAPI(
     title="Docs API",
     description="Document manager API",
     version="0.1.0",
 )
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    levels={
+        "gzip": settings.compression_gzip_level,
+        "br": settings.compression_brotli_level,
+        "zstd": settings.compression_zstd_level,
+    },
+    flush_size=settings.compression_flush_size,
+    flush_interval=settings.compression_flush_interval,
+)
+
+if settings.rate_limit_enabled:
+    app.add_middleware(
+        RateLimitMiddleware,
+        backend=rate_limit_backend,
+        admission=AdmissionController(
+            {
+                "read": settings.admission_max_in_flight_read,
+                "write": settings.admission_max_in_flight_write,
+                "upload": settings.admission_max_in_flight_upload,
+                "export": settings.admission_max_in_flight_export,
+            },
+            pool_monitor=pool_wait_monitor,
+            pool_wait_threshold=settings.admission_pool_wait_threshold_ms / 1000,
+        ),
+        rate_per_minute=settings.rate_limit_per_minute,
+        burst=settings.rate_limit_burst,
+        classify=path_classifier(
+            {
+                "upload": r"/v1/uploads/[^/]+/files/[^/]+",
+                "export": r"/v1/exports/.+",
+            }
+        ),
+    )
+
 app.include_router(health_router)
 app.include_router(users_router)
+app.include_router(documents_router)
+app.include_router(uploads_router)
+app.include_router(exports_router)
+app.include_router(purge_jobs_router)
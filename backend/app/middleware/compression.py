@@ -0,0 +1,316 @@
+import zlib
+from collections.abc import Callable, Mapping
+from typing import Protocol
+
+import anyio
+import brotli
+import zstandard
+from anyio.abc import TaskGroup
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Content types that are already compressed; compressing them again only
+# burns CPU.
+INCOMPRESSIBLE_CONTENT_TYPES = (
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/x-7z-compressed",
+    "application/zstd",
+    "image/",
+    "audio/",
+    "video/",
+    "font/woff",
+)
+
+
+# --- Compressors
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes:
+        """Emit everything buffered so far, keeping the stream open."""
+        ...
+
+    def finish(self) -> bytes:
+        """Emit everything buffered so far and close the stream."""
+        ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    def __init__(self, level: int):
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_compressors() -> dict[str, Callable[[int], Compressor]]:
+    """Return the supported encodings, in server preference order."""
+    return {
+        "zstd": ZstdCompressor,
+        "br": BrotliCompressor,
+        "gzip": GzipCompressor,
+    }
+
+
+DEFAULT_LEVELS = {"gzip": 6, "br": 4, "zstd": 3}
+
+
+# --- Negotiation
+def negotiate_encoding(accept_encoding: str, supported: list[str]) -> str | None:
+    """Pick the encoding to use from an ``Accept-Encoding`` header.
+
+    The highest q-value wins; ties are broken by the order of ``supported``.
+
+    Args:
+        accept_encoding (str): Raw ``Accept-Encoding`` header value.
+        supported (list[str]): Supported encodings, in preference order.
+
+    Returns:
+        str | None: The chosen encoding, or ``None`` to send the body as is.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return not content_type.startswith(INCOMPRESSIBLE_CONTENT_TYPES)
+
+
+# --- Middleware
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with gzip, brotli or zstd.
+
+    Responses sent in a single message are compressed in one go when they are
+    at least ``minimum_size`` bytes. Streaming responses (NDJSON, large text)
+    are compressed chunk by chunk; the compressor is flushed once
+    ``flush_size`` bytes have been fed to it since the last flush, or
+    ``flush_interval`` seconds after the first unflushed chunk. Flushing
+    every chunk would keep latency minimal but costs a few bytes of framing
+    per flush and resets the compressor's block, which inflates small-line
+    output several times over. Already-compressed content types such as PDF
+    or JPEG downloads are passed through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        levels: Mapping[str, int] | None = None,
+        flush_size: int = 16 * 1024,
+        flush_interval: float = 0.1,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.compressors = available_compressors()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept_encoding, list(self.compressors))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Timed flushes run in this task group, next to the application.
+        async with anyio.create_task_group() as task_group:
+            responder = _CompressionResponder(
+                send,
+                encoding=encoding,
+                compressor_factory=lambda: self.compressors[encoding](
+                    self.levels[encoding]
+                ),
+                minimum_size=self.minimum_size,
+                flush_size=self.flush_size,
+                flush_interval=self.flush_interval,
+                task_group=task_group,
+            )
+            await self.app(scope, receive, responder.send)
+            task_group.cancel_scope.cancel()
+
+
+class _CompressionResponder:
+    def __init__(
+        self,
+        send: Send,
+        *,
+        encoding: str,
+        compressor_factory: Callable[[], Compressor],
+        minimum_size: int,
+        flush_size: int,
+        flush_interval: float,
+        task_group: TaskGroup,
+    ):
+        self._send = send
+        self._encoding = encoding
+        self._compressor_factory = compressor_factory
+        self._minimum_size = minimum_size
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._task_group = task_group
+        self._start: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+        # Bytes fed to the compressor since the last flush, and the pending
+        # timed flush. The lock keeps a timed flush from interleaving with a
+        # chunk sent by the application.
+        self._unflushed = 0
+        self._flush_timer: anyio.CancelScope | None = None
+        self._lock = anyio.Lock()
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None:
+            await self._start_response(body, more_body)
+            return
+
+        async with self._lock:
+            await self._write(body, more_body)
+
+    async def _start_response(self, body: bytes, more_body: bool) -> None:
+        start, self._start = self._start, None
+        headers = MutableHeaders(scope=start)
+
+        compressible = start["status"] not in (204, 206, 304) and is_compressible(
+            headers
+        )
+        if compressible:
+            headers.add_vary_header("Accept-Encoding")
+        if not compressible or (not more_body and len(body) < self._minimum_size):
+            self._passthrough = True
+            await self._send(start)
+            await self._send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+            return
+
+        self._compressor = self._compressor_factory()
+        headers["Content-Encoding"] = self._encoding
+        if more_body:
+            del headers["Content-Length"]
+            await self._send(start)
+            async with self._lock:
+                await self._write(body, more_body)
+            return
+
+        data = self._compressor.compress(body) + self._compressor.finish()
+        headers["Content-Length"] = str(len(data))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": data})
+
+    async def _write(self, body: bytes, more_body: bool) -> None:
+        data = self._compressor.compress(body)
+        if not more_body:
+            self._cancel_flush_timer()
+            data += self._compressor.finish()
+            await self._send({"type": "http.response.body", "body": data})
+            return
+
+        self._unflushed += len(body)
+        if self._unflushed >= self._flush_size:
+            self._cancel_flush_timer()
+            data += self._flush()
+        elif self._unflushed and self._flush_timer is None:
+            self._flush_timer = anyio.CancelScope()
+            self._task_group.start_soon(self._flush_later, self._flush_timer)
+        # The compressor only emits output on its own once its internal buffer
+        # fills up; there is nothing to send until then.
+        if data:
+            await self._send(
+                {"type": "http.response.body", "body": data, "more_body": True}
+            )
+
+    async def _flush_later(self, timer: anyio.CancelScope) -> None:
+        with timer:
+            await anyio.sleep(self._flush_interval)
+            async with self._lock:
+                self._flush_timer = None
+                data = self._flush()
+                await self._send(
+                    {"type": "http.response.body", "body": data, "more_body": True}
+                )
+
+    def _flush(self) -> bytes:
+        self._unflushed = 0
+        return self._compressor.flush()
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
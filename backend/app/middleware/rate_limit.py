@@ -0,0 +1,241 @@
+import math
+import re
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Protocol
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.database import PoolWaitMonitor
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+# --- Rate limiting
+class RateLimitBackend(Protocol):
+    """Storage for token buckets.
+
+    The in-process backend is enough for a single worker. Implement this
+    protocol on top of a shared store (e.g. Redis) to enforce limits across
+    several workers or hosts.
+    """
+
+    async def acquire(self, key: str, *, rate: float, capacity: float) -> float:
+        """Try to take one token from the bucket identified by ``key``.
+
+        Args:
+            key (str): Bucket identifier (user, IP, ...).
+            rate (float): Tokens added to the bucket per second.
+            capacity (float): Maximum number of tokens in the bucket.
+
+        Returns:
+            float: ``0`` if the token was taken, otherwise the number of
+                seconds until one becomes available.
+        """
+        ...
+
+
+class InMemoryRateLimitBackend:
+    """Token buckets kept in a dict, local to the current process."""
+
+    def __init__(
+        self,
+        *,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    async def acquire(self, key: str, *, rate: float, capacity: float) -> float:
+        with self._lock:
+            now = self._clock()
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * rate)
+
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return (1 - tokens) / rate
+
+            if key not in self._buckets and len(self._buckets) >= self._max_keys:
+                self._prune(now, rate=rate, capacity=capacity)
+            self._buckets[key] = (tokens - 1, now)
+            return 0.0
+
+    def reset(self) -> None:
+        """Forget every bucket."""
+        with self._lock:
+            self._buckets.clear()
+
+    def _prune(self, now: float, *, rate: float, capacity: float) -> None:
+        # A bucket that has refilled completely behaves exactly like a missing
+        # one, so it can be dropped without changing any limit.
+        self._buckets = {
+            key: (tokens, updated_at)
+            for key, (tokens, updated_at) in self._buckets.items()
+            if tokens + (now - updated_at) * rate < capacity
+        }
+
+
+def client_ip_key(request: Request) -> str:
+    """Default rate limit key: the client IP address."""
+    host = request.client.host if request.client else "unknown"
+    return f"ip:{host}"
+
+
+# --- Admission control
+def classify_route(request: Request) -> str:
+    """Default route class: ``"read"`` or ``"write"``, by HTTP method."""
+    return "read" if request.method in READ_METHODS else "write"
+
+
+def path_classifier(
+    patterns: Mapping[str, str],
+    *,
+    fallback: Callable[[Request], str] = classify_route,
+) -> Callable[[Request], str]:
+    """Build a route classifier that gives some paths a class of their own.
+
+    Use it to keep slow, long-lived requests (uploads, exports, ...) from
+    taking the slots of cheap ones.
+
+    Args:
+        patterns (Mapping[str, str]): Route class for each regular expression,
+            matched against the whole request path.
+        fallback (Callable[[Request], str]): Classifier for paths matching no
+            pattern.
+
+    Returns:
+        Callable[[Request], str]: The classifier.
+    """
+    compiled = [
+        (re.compile(pattern), route_class) for route_class, pattern in patterns.items()
+    ]
+
+    def classify(request: Request) -> str:
+        for pattern, route_class in compiled:
+            if pattern.fullmatch(request.url.path):
+                return route_class
+        return fallback(request)
+
+    return classify
+
+
+class AdmissionController:
+    """Cap in-flight requests per route class and shed load early.
+
+    Requests are never queued: when a class is full, or when the database pool
+    is already making requests wait longer than ``pool_wait_threshold``, new
+    requests are rejected immediately so that the ones already admitted keep a
+    bounded latency.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, int],
+        *,
+        pool_monitor: PoolWaitMonitor | None = None,
+        pool_wait_threshold: float = 0.25,
+    ):
+        self._limits = dict(limits)
+        self._in_flight = dict.fromkeys(self._limits, 0)
+        self._pool_monitor = pool_monitor
+        self._pool_wait_threshold = pool_wait_threshold
+
+    def in_flight(self, route_class: str) -> int:
+        return self._in_flight.get(route_class, 0)
+
+    def try_acquire(self, route_class: str) -> bool:
+        """Admit a request of the given class, if there is room for it.
+
+        Classes without a configured limit are always admitted.
+        """
+        if (
+            self._pool_monitor is not None
+            and self._pool_monitor.current() > self._pool_wait_threshold
+        ):
+            return False
+
+        limit = self._limits.get(route_class)
+        if limit is None:
+            return True
+        if self._in_flight[route_class] >= limit:
+            return False
+
+        self._in_flight[route_class] += 1
+        return True
+
+    def release(self, route_class: str) -> None:
+        if route_class in self._in_flight:
+            self._in_flight[route_class] -= 1
+
+
+# --- Middleware
+class RateLimitMiddleware:
+    """ASGI middleware combining per-client rate limiting and admission control.
+
+    Rejected requests get a ``429`` (client over its rate) or ``503`` (server
+    overloaded) response with a ``Retry-After`` header.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        backend: RateLimitBackend,
+        admission: AdmissionController,
+        rate_per_minute: int,
+        burst: int,
+        key_func: Callable[[Request], str] = client_ip_key,
+        classify: Callable[[Request], str] = classify_route,
+        exempt_paths: frozenset[str] = frozenset({"/health"}),
+        overload_retry_after: int = 1,
+    ):
+        self.app = app
+        self.backend = backend
+        self.admission = admission
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self.key_func = key_func
+        self.classify = classify
+        self.exempt_paths = exempt_paths
+        self.overload_retry_after = overload_retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
+        retry_after = await self.backend.acquire(
+            self.key_func(request), rate=self.rate, capacity=self.burst
+        )
+        if retry_after > 0:
+            response = _reject(429, "Too many requests", retry_after)
+            await response(scope, receive, send)
+            return
+
+        route_class = self.classify(request)
+        if not self.admission.try_acquire(route_class):
+            response = _reject(503, "Server is overloaded", self.overload_retry_after)
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.admission.release(route_class)
+
+
+def _reject(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        {"detail": detail},
+        status_code=status_code,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
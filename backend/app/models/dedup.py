@@ -0,0 +1,37 @@
+from sqlalchemy import BigInteger, ForeignKey, Index, LargeBinary, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class DocumentFingerprint(Base):
+    """MinHash signature of a document's extracted text."""
+
+    __tablename__ = "document_fingerprints"
+
+    document_id: Mapped[int] = mapped_column(
+        ForeignKey("documents.id"), primary_key=True
+    )
+    minhash: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class DocumentLshBucket(Base):
+    """One LSH band of a document's MinHash signature.
+
+    Documents sharing a ``(user_id, band, bucket)`` row are near-duplicate
+    candidates, so lookups are index scans instead of comparisons against
+    every document.
+    """
+
+    __tablename__ = "document_lsh_buckets"
+    __table_args__ = (
+        Index("ix_document_lsh_buckets_lookup", "user_id", "band", "bucket"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    document_id: Mapped[int] = mapped_column(
+        ForeignKey("documents.id"), nullable=False, index=True
+    )
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    band: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    bucket: Mapped[int] = mapped_column(BigInteger, nullable=False)
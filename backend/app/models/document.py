@@ -0,0 +1,121 @@
+from datetime import UTC, datetime
+from pathlib import PurePosixPath
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.database import Base
+from app.models.tag import Tag
+
+
+class Document(Base):
+    __tablename__ = "documents"
+    # Lookups of a user's visible documents skip soft-deleted rows entirely.
+    __table_args__ = (
+        Index(
+            "ix_documents_user_id_active",
+            "user_id",
+            sqlite_where=text("deleted_at IS NULL"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id"), nullable=False, index=True
+    )
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text)
+    # Text extracted from the document's files, used for tag suggestions.
+    content: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    files: Mapped[list["DocumentFile"]] = relationship(
+        back_populates="document", order_by="DocumentFile.id"
+    )
+    notes: Mapped[list["DocumentNote"]] = relationship(
+        back_populates="document", order_by="DocumentNote.id"
+    )
+    tags: Mapped[list["DocumentTag"]] = relationship(
+        back_populates="document", order_by="DocumentTag.id"
+    )
+
+    @property
+    def text(self) -> str:
+        """Title, description and extracted content, joined."""
+        parts = (self.title, self.description, self.content)
+        return "\n".join(part for part in parts if part)
+
+
+class DocumentFile(Base):
+    __tablename__ = "document_files"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    document_id: Mapped[int] = mapped_column(
+        ForeignKey("documents.id"), nullable=False, index=True
+    )
+    # Path relative to the storage directory. The original filename is its
+    # last component, so it is not stored separately.
+    path: Mapped[str] = mapped_column(String(1024), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    sha256: Mapped[str | None] = mapped_column(String(64), index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+    document: Mapped["Document"] = relationship(back_populates="files")
+
+    @property
+    def filename(self) -> str:
+        return PurePosixPath(self.path).name
+
+
+class DocumentNote(Base):
+    __tablename__ = "document_notes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    document_id: Mapped[int] = mapped_column(
+        ForeignKey("documents.id"), nullable=False, index=True
+    )
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+    document: Mapped["Document"] = relationship(back_populates="notes")
+
+
+class DocumentTag(Base):
+    __tablename__ = "document_tags"
+    __table_args__ = (UniqueConstraint("document_id", "tag_id", "user_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    document_id: Mapped[int] = mapped_column(
+        ForeignKey("documents.id"), nullable=False, index=True
+    )
+    tag_id: Mapped[int] = mapped_column(
+        ForeignKey("tags.id"), nullable=False, index=True
+    )
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id"), nullable=False, index=True
+    )
+    color: Mapped[str | None] = mapped_column(String(7))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+    document: Mapped["Document"] = relationship(back_populates="tags")
+    tag: Mapped[Tag] = relationship()
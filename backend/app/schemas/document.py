@@ -0,0 +1,33 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class DocumentFileRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    filename: str
+    size: int
+
+
+class DocumentRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    title: str
+    description: str | None
+    files: list[DocumentFileRead]
+
+
+class DuplicateRead(BaseModel):
+    document_id: int
+    title: str
+    similarity: float
+
+
+class DocumentUploadRead(DocumentRead):
+    possible_duplicates: list[DuplicateRead] = []
+
+
+class DocumentMerge(BaseModel):
+    source_document_id: int
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class PurgeJobRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    entity_type: str
+    entity_id: int
+    status: str
+    total: int
+    processed: int
+    error: str | None
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TagRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+class DocumentTagCreate(BaseModel):
+    user_id: int
+    name: str = Field(min_length=1, max_length=255)
+    color: str | None = Field(default=None, pattern=r"^#[0-9a-fA-F]{6}$")
+
+
+class DocumentTagRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    document_id: int
+    user_id: int
+    color: str | None
+    tag: TagRead
+
+
+class TagSuggestion(BaseModel):
+    tag: TagRead
+    score: float
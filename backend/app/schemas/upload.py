@@ -0,0 +1,33 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class UploadFileCreate(BaseModel):
+    filename: str = Field(min_length=1, max_length=255)
+    size: int = Field(ge=0)
+
+
+class UploadSessionCreate(BaseModel):
+    user_id: int
+    title: str | None = None
+    description: str | None = None
+    files: list[UploadFileCreate] = Field(min_length=1)
+
+
+class UploadSessionFileRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    filename: str
+    size: int
+    offset: int
+    complete: bool
+
+
+class UploadSessionRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    user_id: int
+    title: str | None
+    description: str | None
+    files: list[UploadSessionFileRead]
@@ -0,0 +1,248 @@
+import os
+from contextlib import suppress
+from pathlib import Path, PurePosixPath
+
+import numpy as np
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.database import read_only
+from app.models.dedup import DocumentFingerprint, DocumentLshBucket
+from app.models.document import Document, DocumentFile
+from app.services.minhash import estimate_similarity, lsh_buckets, minhash_signature
+
+
+def _unique_filename(filename: str, taken: set[str]) -> str:
+    name = PurePosixPath(filename)
+    counter = 1
+    while filename in taken:
+        filename = f"{name.stem} ({counter}){name.suffix}"
+        counter += 1
+    return filename
+
+
+class DedupService:
+    def __init__(self, session: Session, storage_dir: Path, *, threshold: float = 0.8):
+        self._db = session
+        self._storage_dir = storage_dir
+        self._threshold = threshold
+
+    def _get_document(self, document_id: int) -> Document:
+        return self._db.execute(
+            select(Document).where(
+                Document.id == document_id, Document.deleted_at.is_(None)
+            )
+        ).scalar_one()
+
+    def _signature(self, document_id: int) -> np.ndarray | None:
+        minhash = self._db.execute(
+            select(DocumentFingerprint.minhash).where(
+                DocumentFingerprint.document_id == document_id
+            )
+        ).scalar_one_or_none()
+        return None if minhash is None else np.frombuffer(minhash, dtype=np.uint32)
+
+    def _unindex(self, document_id: int) -> None:
+        self._db.execute(
+            delete(DocumentLshBucket).where(
+                DocumentLshBucket.document_id == document_id
+            )
+        )
+        self._db.execute(
+            delete(DocumentFingerprint).where(
+                DocumentFingerprint.document_id == document_id
+            )
+        )
+
+    def index_document(self, document_id: int) -> None:
+        """Store the MinHash signature and LSH buckets of a document.
+
+        Documents without extracted content are not indexed; they can still be
+        detected as exact duplicates through their file hashes.
+
+        Args:
+            document_id (int): ID of the document to index.
+
+        Raises:
+            NoResultFound: If no document with the given ID exists.
+        """
+        document = self._get_document(document_id)
+        self._unindex(document.id)
+
+        signature = minhash_signature(document.content or "")
+        if signature is not None:
+            self._db.add(
+                DocumentFingerprint(
+                    document_id=document.id, minhash=signature.tobytes()
+                )
+            )
+            self._db.add_all(
+                DocumentLshBucket(
+                    document_id=document.id,
+                    user_id=document.user_id,
+                    band=band,
+                    bucket=bucket,
+                )
+                for band, bucket in enumerate(lsh_buckets(signature))
+            )
+        self._db.commit()
+
+    @read_only
+    def find_duplicates(self, document_id: int) -> list[tuple[Document, float]]:
+        """Find documents of the same user that duplicate the given one.
+
+        Documents sharing a file with the same SHA-256 are exact duplicates
+        (similarity ``1.0``). Otherwise, candidates sharing an LSH bucket are
+        kept when their estimated similarity reaches the threshold.
+
+        Args:
+            document_id (int): ID of the document to check.
+
+        Returns:
+            list[tuple[Document, float]]: Duplicates and their similarity,
+                most similar first.
+
+        Raises:
+            NoResultFound: If no document with the given ID exists.
+        """
+        document = self._get_document(document_id)
+        matches: dict[int, float] = {}
+
+        hashes = [file.sha256 for file in document.files if file.sha256]
+        if hashes:
+            exact = self._db.execute(
+                select(DocumentFile.document_id)
+                .join(Document)
+                .where(
+                    Document.user_id == document.user_id,
+                    Document.id != document.id,
+                    Document.deleted_at.is_(None),
+                    DocumentFile.sha256.in_(hashes),
+                )
+            ).scalars()
+            matches.update(dict.fromkeys(exact, 1.0))
+
+        signature = self._signature(document.id)
+        if signature is not None:
+            keys = list(enumerate(lsh_buckets(signature)))
+            candidates = self._db.execute(
+                select(
+                    DocumentFingerprint.document_id, DocumentFingerprint.minhash
+                ).where(
+                    DocumentFingerprint.document_id.in_(
+                        select(DocumentLshBucket.document_id).where(
+                            DocumentLshBucket.user_id == document.user_id,
+                            tuple_(
+                                DocumentLshBucket.band, DocumentLshBucket.bucket
+                            ).in_(keys),
+                        )
+                    ),
+                    DocumentFingerprint.document_id != document.id,
+                )
+            ).all()
+            for candidate_id, minhash in candidates:
+                similarity = estimate_similarity(
+                    signature, np.frombuffer(minhash, dtype=np.uint32)
+                )
+                if similarity >= self._threshold:
+                    matches.setdefault(candidate_id, similarity)
+
+        if not matches:
+            return []
+        documents = self._db.execute(
+            select(Document).where(
+                Document.id.in_(matches), Document.deleted_at.is_(None)
+            )
+        ).scalars()
+        return sorted(
+            ((duplicate, matches[duplicate.id]) for duplicate in documents),
+            key=lambda item: (-item[1], item[0].id),
+        )
+
+    def merge_documents(self, target_id: int, source_id: int) -> Document:
+        """Merge a duplicate document into another one.
+
+        Files, notes and tags of ``source`` are moved to ``target``; the
+        blobs of moved files are moved into ``target``'s storage directory
+        too, so nothing keeps living under the deleted document's ID. Files
+        whose content already exists in ``target`` and tags it already has
+        are dropped, blobs included. Files without a hash are always moved.
+        ``source`` is then deleted and ``target`` re-indexed.
+
+        Args:
+            target_id (int): ID of the document to keep.
+            source_id (int): ID of the document to merge and delete.
+
+        Returns:
+            Document: The merged document.
+
+        Raises:
+            NoResultFound: If either document does not exist.
+            ValueError: If both IDs are the same or the owners differ.
+        """
+        if target_id == source_id:
+            raise ValueError("Cannot merge a document into itself")
+        target = self._get_document(target_id)
+        source = self._get_document(source_id)
+        if target.user_id != source.user_id:
+            raise ValueError("Cannot merge documents of different users")
+
+        target_hashes = {file.sha256 for file in target.files if file.sha256}
+        taken = {file.filename for file in target.files}
+        dropped_paths = []
+        moves = []
+        for file in list(source.files):
+            if file.sha256 and file.sha256 in target_hashes:
+                dropped_paths.append(self._storage_dir / file.path)
+                self._db.delete(file)
+                continue
+            if file.sha256:
+                target_hashes.add(file.sha256)
+            filename = _unique_filename(file.filename, taken)
+            taken.add(filename)
+            new_path = str(PurePosixPath("documents", str(target.id), filename))
+            moves.append((self._storage_dir / file.path, self._storage_dir / new_path))
+            file.path = new_path
+            file.document = target
+
+        target_tags = {(tag.tag_id, tag.user_id) for tag in target.tags}
+        for document_tag in list(source.tags):
+            if (document_tag.tag_id, document_tag.user_id) in target_tags:
+                self._db.delete(document_tag)
+            else:
+                document_tag.document = target
+
+        for note in list(source.notes):
+            note.document = target
+
+        if source.content and source.content != target.content:
+            target.content = "\n".join(filter(None, (target.content, source.content)))
+
+        self._unindex(source.id)
+        self._db.flush()
+        self._db.delete(source)
+
+        # Blobs are moved before committing and moved back if the commit
+        # fails, so rows never point at a path that does not exist.
+        moved = []
+        try:
+            for old_path, new_path in moves:
+                new_path.parent.mkdir(parents=True, exist_ok=True)
+                if old_path.exists():
+                    os.replace(old_path, new_path)
+                    moved.append((old_path, new_path))
+            self._db.commit()
+        except Exception:
+            self._db.rollback()
+            for old_path, new_path in reversed(moved):
+                os.replace(new_path, old_path)
+            raise
+
+        for path in dropped_paths:
+            path.unlink(missing_ok=True)
+        with suppress(OSError):
+            (self._storage_dir / "documents" / str(source_id)).rmdir()
+
+        self.index_document(target.id)
+        self._db.refresh(target)
+        return target
@@ -0,0 +1,57 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from app.database import read_only
+from app.models.document import Document
+
+
+class DocumentService:
+    def __init__(self, session: Session):
+        self._db = session
+
+    def _get_document(self, document_id: int) -> Document:
+        return self._db.execute(
+            select(Document).where(
+                Document.id == document_id, Document.deleted_at.is_(None)
+            )
+        ).scalar_one()
+
+    @read_only
+    def get_document(self, document_id: int) -> Document:
+        """Get a document by ID, with its files loaded.
+
+        Args:
+            document_id (int): ID of the document to retrieve.
+
+        Returns:
+            Document: The matching document.
+
+        Raises:
+            NoResultFound: If no document with the given ID exists or it was
+                deleted.
+        """
+        # Loaded here, on the replica: a lazy load during serialization
+        # would run after the method returns and hit the primary.
+        return self._db.execute(
+            select(Document)
+            .where(Document.id == document_id, Document.deleted_at.is_(None))
+            .options(selectinload(Document.files))
+        ).scalar_one()
+
+    def delete_document(self, document_id: int) -> None:
+        """Soft-delete an existing document.
+
+        The document is hidden right away; a purge job removes its rows and
+        files afterwards.
+
+        Args:
+            document_id (int): ID of the document to delete.
+
+        Raises:
+            NoResultFound: If no document with the given ID exists.
+        """
+        document = self._get_document(document_id)
+        document.deleted_at = datetime.now(UTC)
+        self._db.commit()
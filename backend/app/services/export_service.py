@@ -0,0 +1,247 @@
+import contextlib
+import io
+import json
+import tempfile
+import zipfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
+
+from sqlalchemy import Select, and_, select
+from sqlalchemy.orm import Session, defer, selectinload
+
+from app.database import read_only
+from app.models.document import Document, DocumentTag
+from app.models.tag import Tag
+
+CHUNK_SIZE = 64 * 1024
+EXPORT_BATCH_SIZE = 100
+MANIFEST_SPOOL_SIZE = 1024 * 1024
+
+# Formats that are already compressed; deflating them again wastes CPU.
+STORED_EXTENSIONS = frozenset(
+    {
+        ".pdf",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".heic",
+        ".zip",
+        ".gz",
+        ".7z",
+        ".zst",
+        ".mp3",
+        ".mp4",
+    }
+)
+
+_EXPORT_OPTIONS = (
+    # Extracted text can be large and is not part of the export.
+    defer(Document.content),
+    selectinload(Document.files),
+    selectinload(Document.notes),
+    selectinload(Document.tags).selectinload(DocumentTag.tag),
+)
+
+
+class _ZipStream(io.RawIOBase):
+    """Write-only, unseekable sink that hands out what has been written so far.
+
+    Being unseekable makes ``zipfile`` write data descriptors after each entry
+    instead of seeking back to patch local headers, which is what allows the
+    archive to be streamed.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(
+    entries: Iterable[tuple[str, Path | BinaryIO, int]],
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Build a ZIP archive on the fly, yielding it piece by piece.
+
+    Files are read ``chunk_size`` bytes at a time and written to the archive
+    as they are read, so memory use does not depend on the archive size.
+    ZIP64 records are added automatically for large files and archives with
+    many entries.
+
+    Args:
+        entries (Iterable[tuple[str, Path | BinaryIO, int]]): Archive name,
+            source and size of each file. The source is either a path on disk
+            or a binary file positioned at the start of the contents.
+        chunk_size (int): Size of the reads from each source.
+
+    Yields:
+        bytes: Consecutive pieces of the archive.
+    """
+    sink = _ZipStream()
+    with zipfile.ZipFile(sink, mode="w") as archive:
+        for arcname, source, size in entries:
+            info = zipfile.ZipInfo(arcname)
+            info.file_size = size
+            info.compress_type = (
+                zipfile.ZIP_STORED
+                if PurePosixPath(arcname).suffix.lower() in STORED_EXTENSIONS
+                else zipfile.ZIP_DEFLATED
+            )
+            with contextlib.ExitStack() as stack:
+                if isinstance(source, Path):
+                    source = stack.enter_context(source.open("rb"))
+                target = stack.enter_context(archive.open(info, mode="w"))
+                while chunk := source.read(chunk_size):
+                    target.write(chunk)
+                    yield sink.drain()
+            yield sink.drain()
+
+    yield sink.drain()
+
+
+class ExportService:
+    def __init__(self, session: Session, storage_dir: Path):
+        self._db = session
+        self._storage_dir = storage_dir
+
+    @read_only
+    def document_archive(self, document_id: int) -> Iterator[bytes]:
+        """Return a streamed ZIP archive with every file of a document.
+
+        Args:
+            document_id (int): ID of the document to export.
+
+        Returns:
+            Iterator[bytes]: The archive, produced lazily.
+
+        Raises:
+            NoResultFound: If no document with the given ID exists.
+        """
+        condition = and_(Document.id == document_id, Document.deleted_at.is_(None))
+        self._db.execute(select(Document.id).where(condition)).scalar_one()
+        return self._archive(select(Document).where(condition))
+
+    @read_only
+    def tag_archive(self, user_id: int, tag_name: str) -> Iterator[bytes]:
+        """Return a streamed ZIP archive with every document a user tagged.
+
+        Args:
+            user_id (int): ID of the user who assigned the tag.
+            tag_name (str): Name of the tag.
+
+        Returns:
+            Iterator[bytes]: The archive, produced lazily.
+
+        Raises:
+            NoResultFound: If no tag with the given name exists.
+        """
+        tag = self._db.execute(select(Tag).where(Tag.name == tag_name)).scalar_one()
+        return self._archive(
+            select(Document)
+            .join(DocumentTag)
+            .where(
+                DocumentTag.tag_id == tag.id,
+                DocumentTag.user_id == user_id,
+                Document.deleted_at.is_(None),
+            )
+        )
+
+    @read_only
+    def _documents_after(self, query: Select, after_id: int) -> list[Document]:
+        return list(
+            self._db.execute(
+                query.where(Document.id > after_id)
+                .order_by(Document.id)
+                .limit(EXPORT_BATCH_SIZE)
+                .options(*_EXPORT_OPTIONS)
+            ).scalars()
+        )
+
+    def _documents(self, query: Select) -> Iterator[Document]:
+        # Documents are loaded a batch at a time, and the read transaction
+        # ends after each batch, so a slow download holds neither many rows
+        # nor a connection.
+        after_id = 0
+        while documents := self._documents_after(query, after_id):
+            yield from documents
+            after_id = documents[-1].id
+            self._db.commit()
+
+    def _archive(self, query: Select) -> Iterator[bytes]:
+        return stream_zip(self._entries(query))
+
+    def _entries(self, query: Select) -> Iterator[tuple[str, Path | BinaryIO, int]]:
+        # The manifest is written last, so it can be collected while the
+        # files stream; it is spooled to disk once it grows large.
+        with tempfile.SpooledTemporaryFile(max_size=MANIFEST_SPOOL_SIZE) as manifest:
+            manifest.write(b'{"documents": [')
+            separator = b""
+            for document in self._documents(query):
+                entries = []
+                files = []
+                for document_file in document.files:
+                    arcname = f"{document.id}/{document_file.filename}"
+                    entries.append(
+                        (
+                            arcname,
+                            self._storage_dir / document_file.path,
+                            document_file.size,
+                        )
+                    )
+                    files.append(
+                        {
+                            "path": arcname,
+                            "filename": document_file.filename,
+                            "size": document_file.size,
+                        }
+                    )
+                record = {
+                    "id": document.id,
+                    "title": document.title,
+                    "description": document.description,
+                    "created_at": document.created_at,
+                    "files": files,
+                    "notes": [
+                        {
+                            "user_id": note.user_id,
+                            "content": note.content,
+                            "created_at": note.created_at,
+                        }
+                        for note in document.notes
+                    ],
+                    "tags": [
+                        {
+                            "name": document_tag.tag.name,
+                            "user_id": document_tag.user_id,
+                            "color": document_tag.color,
+                        }
+                        for document_tag in document.tags
+                    ],
+                }
+                manifest.write(separator + json.dumps(record, default=str).encode())
+                separator = b", "
+                yield from entries
+
+            manifest.write(b"]}")
+            size = manifest.tell()
+            manifest.seek(0)
+            yield "manifest.json", manifest, size
@@ -0,0 +1,74 @@
+import hashlib
+import re
+import zlib
+
+import numpy as np
+
+NUM_PERM = 128
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(seed=1)
+# Fixed seed: signatures are persisted, so the permutations must never change.
+_A = _rng.integers(1, _MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, _MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """Return the distinct hashed word n-grams of a text."""
+    words = TOKEN_RE.findall(text.lower())
+    if len(words) < size:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+    return np.unique(
+        np.fromiter(
+            (zlib.crc32(gram.encode()) for gram in grams),
+            dtype=np.uint64,
+            count=len(grams),
+        )
+    )
+
+
+def minhash_signature(text: str) -> np.ndarray | None:
+    """Compute the MinHash signature of a text.
+
+    All permutations are applied at once as a ``(shingles, NUM_PERM)`` array
+    of universal hashes ``(a * x + b) mod p``.
+
+    Returns:
+        np.ndarray | None: ``NUM_PERM`` uint32 values, or ``None`` if the text
+            has no words.
+    """
+    hashed = shingles(text) % _MERSENNE_PRIME
+    if hashed.size == 0:
+        return None
+    permuted = (hashed[:, None] * _A + _B) % _MERSENNE_PRIME
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def lsh_buckets(signature: np.ndarray) -> list[int]:
+    """Hash each band of a signature into a signed 64-bit bucket key.
+
+    With 16 bands of 8 rows, two documents with Jaccard similarity ``s``
+    share at least one bucket with probability ``1 - (1 - s^8)^16``: about
+    97% at ``s = 0.8`` and under 5% at ``s = 0.5``.
+    """
+    bands = signature.reshape(BANDS, ROWS_PER_BAND)
+    return [
+        int.from_bytes(
+            hashlib.blake2b(band.tobytes(), digest_size=8).digest(),
+            "big",
+            signed=True,
+        )
+        for band in bands
+    ]
+
+
+def estimate_similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimate the Jaccard similarity of two texts from their signatures."""
+    return float(np.mean(first == second))
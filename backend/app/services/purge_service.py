@@ -0,0 +1,226 @@
+import shutil
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.dedup import DocumentFingerprint, DocumentLshBucket
+from app.models.document import Document, DocumentFile, DocumentNote, DocumentTag
+from app.models.purge import PurgeJob
+from app.models.upload import UploadSession
+from app.models.user import User, UserProfile
+
+ENTITY_TYPES = frozenset({"user", "document"})
+
+
+class PurgeService:
+    """Remove soft-deleted users and documents in bounded batches.
+
+    Each batch deletes the dependent rows of at most ``batch_size`` documents
+    and commits, so no transaction holds locks for long. Every document keeps
+    its files in its own ``documents/<id>/`` directory, which is removed once
+    the batch is committed.
+    """
+
+    def __init__(self, session: Session, storage_dir: Path, *, batch_size: int = 500):
+        self._db = session
+        self._storage_dir = storage_dir
+        self._batch_size = batch_size
+
+    def _documents_query(self, job: PurgeJob):
+        if job.entity_type == "user":
+            # Every document of a deleted user goes, even one created after
+            # the user was deleted.
+            return (
+                select(Document.id)
+                .join(User, Document.user_id == User.id)
+                .where(User.id == job.entity_id, User.deleted_at.is_not(None))
+            )
+        return select(Document.id).where(
+            Document.id == job.entity_id, Document.deleted_at.is_not(None)
+        )
+
+    def create_job(self, entity_type: str, entity_id: int) -> PurgeJob:
+        """Create a pending job to purge a soft-deleted entity.
+
+        Args:
+            entity_type (str): Either ``"user"`` or ``"document"``.
+            entity_id (int): ID of the soft-deleted entity.
+
+        Returns:
+            PurgeJob: The new job, with the number of documents to remove.
+
+        Raises:
+            ValueError: If the entity type is not supported.
+        """
+        if entity_type not in ENTITY_TYPES:
+            raise ValueError(f"Unsupported entity type: {entity_type}")
+
+        job = PurgeJob(entity_type=entity_type, entity_id=entity_id)
+        job.total = self._db.execute(
+            select(func.count()).select_from(self._documents_query(job).subquery())
+        ).scalar_one()
+        self._db.add(job)
+        self._db.commit()
+        self._db.refresh(job)
+        return job
+
+    def get_job(self, job_id: int) -> PurgeJob:
+        """Get a purge job by ID.
+
+        Args:
+            job_id (int): ID of the job to retrieve.
+
+        Returns:
+            PurgeJob: The matching job.
+
+        Raises:
+            NoResultFound: If no job with the given ID exists.
+        """
+        return self._db.execute(
+            select(PurgeJob).where(PurgeJob.id == job_id)
+        ).scalar_one()
+
+    def run(self, job_id: int) -> PurgeJob:
+        """Run a purge job to completion.
+
+        Progress is committed after every batch, so an interrupted job can
+        be run again and resumes where it stopped. Failures are recorded on
+        the job instead of being raised.
+
+        Args:
+            job_id (int): ID of the job to run.
+
+        Returns:
+            PurgeJob: The finished job.
+
+        Raises:
+            NoResultFound: If no job with the given ID exists.
+        """
+        job = self.get_job(job_id)
+        job.status = "running"
+        job.error = None
+        self._db.commit()
+
+        try:
+            while document_ids := (
+                self._db.execute(
+                    self._documents_query(job)
+                    .order_by(Document.id)
+                    .limit(self._batch_size)
+                )
+                .scalars()
+                .all()
+            ):
+                self._purge_documents(document_ids)
+                job.processed += len(document_ids)
+                self._db.commit()
+                # Files are only removed once the rows are gone for good.
+                for document_id in document_ids:
+                    shutil.rmtree(
+                        self._storage_dir / "documents" / str(document_id),
+                        ignore_errors=True,
+                    )
+            if job.entity_type == "user":
+                self._purge_user(job.entity_id)
+            job.status = "completed"
+        except Exception as ex:
+            print(ex)
+            self._db.rollback()
+            job.status = "failed"
+            job.error = str(ex)
+        self._db.commit()
+        self._db.refresh(job)
+        return job
+
+    def resume_jobs(self, *, stale_after: timedelta) -> list[PurgeJob]:
+        """Run every job that was interrupted or failed.
+
+        Jobs are normally run in-process right after the delete request, so
+        a restart can leave them ``pending`` or ``running`` forever. Those
+        that have made no progress within ``stale_after`` are taken over, as
+        are failed jobs. Each job is claimed with a conditional update first,
+        so several runners never work on the same job.
+
+        Args:
+            stale_after (timedelta): How long a pending or running job may go
+                without progress before it is considered abandoned.
+
+        Returns:
+            list[PurgeJob]: The jobs that were run, once finished.
+        """
+        cutoff = datetime.now(UTC) - stale_after
+        candidates = self._db.execute(
+            select(PurgeJob.id, PurgeJob.status, PurgeJob.updated_at)
+            .where(
+                or_(
+                    PurgeJob.status == "failed",
+                    and_(
+                        PurgeJob.status.in_(("pending", "running")),
+                        PurgeJob.updated_at < cutoff,
+                    ),
+                )
+            )
+            .order_by(PurgeJob.id)
+        ).all()
+
+        jobs = []
+        for job_id, job_status, updated_at in candidates:
+            claimed = self._db.execute(
+                update(PurgeJob)
+                .where(
+                    PurgeJob.id == job_id,
+                    PurgeJob.status == job_status,
+                    PurgeJob.updated_at == updated_at,
+                )
+                .values(status="running", updated_at=datetime.now(UTC))
+                .execution_options(synchronize_session=False)
+            )
+            self._db.commit()
+            if claimed.rowcount == 1:
+                jobs.append(self.run(job_id))
+        return jobs
+
+    def _purge_documents(self, document_ids: Sequence[int]) -> None:
+        for model, column in (
+            (DocumentTag, DocumentTag.document_id),
+            (DocumentNote, DocumentNote.document_id),
+            (DocumentLshBucket, DocumentLshBucket.document_id),
+            (DocumentFingerprint, DocumentFingerprint.document_id),
+            (DocumentFile, DocumentFile.document_id),
+            (Document, Document.id),
+        ):
+            self._db.execute(delete(model).where(column.in_(document_ids)))
+
+    def _purge_user(self, user_id: int) -> None:
+        deleted = self._db.execute(
+            select(User.id).where(User.id == user_id, User.deleted_at.is_not(None))
+        ).scalar_one_or_none()
+        if deleted is None:
+            return
+
+        # Rows the user left on documents of other users.
+        self._db.execute(delete(DocumentTag).where(DocumentTag.user_id == user_id))
+        self._db.execute(delete(DocumentNote).where(DocumentNote.user_id == user_id))
+
+        uploads = (
+            self._db.execute(
+                select(UploadSession).where(UploadSession.user_id == user_id)
+            )
+            .scalars()
+            .all()
+        )
+        for upload in uploads:
+            self._db.delete(upload)
+
+        self._db.execute(delete(UserProfile).where(UserProfile.user_id == user_id))
+        self._db.execute(delete(User).where(User.id == user_id))
+        self._db.commit()
+
+        for upload in uploads:
+            shutil.rmtree(self._storage_dir / "uploads" / upload.id, ignore_errors=True)
+        shutil.rmtree(
+            self._storage_dir / "models" / "tags" / str(user_id), ignore_errors=True
+        )
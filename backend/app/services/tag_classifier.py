@@ -0,0 +1,205 @@
+import fcntl
+import json
+import os
+import re
+import zlib
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+# Changing the number of features invalidates every persisted model.
+N_FEATURES = 2**14
+INITIAL_CAPACITY = 8
+
+TOKEN_RE = re.compile(r"\w{2,}")
+
+
+def hash_features(
+    text: str, n_features: int = N_FEATURES
+) -> tuple[np.ndarray, np.ndarray]:
+    """Turn text into a sparse, L2-normalized hashed term vector.
+
+    Term frequencies are dampened with ``1 + log(tf)`` so that a word repeated
+    many times does not dominate the vector.
+
+    Args:
+        text (str): Text to vectorize.
+        n_features (int): Dimension of the hashed feature space.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Sorted feature indices and their values.
+    """
+    tokens = TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+    hashes = np.fromiter(
+        (zlib.crc32(token.encode()) for token in tokens),
+        dtype=np.uint32,
+        count=len(tokens),
+    )
+    indices, counts = np.unique(hashes % n_features, return_counts=True)
+    values = 1 + np.log(counts)
+    values /= np.linalg.norm(values)
+    return indices.astype(np.intp), values.astype(np.float32)
+
+
+class TagClassifier:
+    """Per-user nearest-centroid tag classifier over hashed term vectors.
+
+    Each tag is represented by the sum of the vectors of the documents the
+    user assigned it to; documents are scored by cosine similarity against
+    every tag at once. Learning a new example only touches the non-zero
+    features of that document, so there is never a full retrain.
+
+    The model lives in ``model_dir``:
+
+    - ``weights.npy``: ``(n_features, capacity)`` float32 matrix, one column
+      per tag, memory-mapped so only the rows a document uses are read.
+    - ``sq_norms.npy``: squared norm of each column.
+    - ``tags.json``: tag ID of each column and its number of examples.
+
+    Learning holds an exclusive ``flock`` on the model directory, so learners
+    in other threads and other worker processes wait for each other. Scoring
+    takes no lock: ``sq_norms.npy`` and ``tags.json`` are replaced atomically
+    and ``weights.npy`` is only updated in place, so a reader never sees a
+    truncated file.
+    """
+
+    def __init__(self, model_dir: Path, *, n_features: int = N_FEATURES):
+        self._dir = model_dir
+        self._n_features = n_features
+
+    @property
+    def _weights_path(self) -> Path:
+        return self._dir / "weights.npy"
+
+    @property
+    def _sq_norms_path(self) -> Path:
+        return self._dir / "sq_norms.npy"
+
+    @property
+    def _tags_path(self) -> Path:
+        return self._dir / "tags.json"
+
+    def _load_tags(self) -> dict:
+        if not self._tags_path.exists():
+            return {"tag_ids": [], "counts": []}
+        return json.loads(self._tags_path.read_text())
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        with (self._dir / "lock").open("w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def _save_sq_norms(self, sq_norms: np.ndarray) -> None:
+        tmp = self._sq_norms_path.with_suffix(".tmp")
+        with tmp.open("wb") as file:
+            np.save(file, sq_norms)
+        os.replace(tmp, self._sq_norms_path)
+
+    def _save_tags(self, tags: dict) -> None:
+        tmp = self._tags_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(tags))
+        os.replace(tmp, self._tags_path)
+
+    def _grow(self, capacity: int) -> None:
+        weights = np.lib.format.open_memmap(
+            self._weights_path.with_suffix(".tmp"),
+            mode="w+",
+            dtype=np.float32,
+            shape=(self._n_features, capacity),
+        )
+        sq_norms = np.zeros(capacity, dtype=np.float64)
+        if self._weights_path.exists():
+            old_weights = np.load(self._weights_path, mmap_mode="r")
+            weights[:, : old_weights.shape[1]] = old_weights
+            old_sq_norms = np.load(self._sq_norms_path)
+            sq_norms[: old_sq_norms.shape[0]] = old_sq_norms
+            del old_weights
+        weights.flush()
+        del weights
+
+        os.replace(self._weights_path.with_suffix(".tmp"), self._weights_path)
+        self._save_sq_norms(sq_norms)
+
+    def learn(self, tag_id: int, text: str) -> None:
+        """Add a document to the centroid of a tag.
+
+        Args:
+            tag_id (int): ID of the tag the user assigned.
+            text (str): Text of the tagged document.
+        """
+        indices, values = hash_features(text, self._n_features)
+        if indices.size == 0:
+            return
+
+        with self._lock():
+            tags = self._load_tags()
+
+            if tag_id in tags["tag_ids"]:
+                column = tags["tag_ids"].index(tag_id)
+            else:
+                column = len(tags["tag_ids"])
+                capacity = (
+                    np.load(self._sq_norms_path).shape[0]
+                    if self._sq_norms_path.exists()
+                    else 0
+                )
+                if column >= capacity:
+                    self._grow(max(INITIAL_CAPACITY, capacity * 2))
+                tags["tag_ids"].append(tag_id)
+                tags["counts"].append(0)
+
+            weights = np.load(self._weights_path, mmap_mode="r+")
+            sq_norms = np.load(self._sq_norms_path)
+
+            current = weights[indices, column]
+            # ||w + x||^2 = ||w||^2 + 2 w.x + ||x||^2, using only non-zeros.
+            sq_norms[column] += 2 * float(current @ values) + float(values @ values)
+            weights[indices, column] = current + values
+            weights.flush()
+            del weights
+
+            self._save_sq_norms(sq_norms)
+            tags["counts"][column] += 1
+            self._save_tags(tags)
+
+    def score(self, texts: Sequence[str]) -> tuple[list[int], np.ndarray]:
+        """Score a batch of documents against every known tag.
+
+        The union of the features used by the batch is gathered from the
+        weight matrix once, and all documents are scored with a single
+        matrix product.
+
+        Args:
+            texts (Sequence[str]): Texts of the documents to score.
+
+        Returns:
+            tuple[list[int], np.ndarray]: Tag IDs, and a ``(len(texts),
+                len(tag_ids))`` matrix of cosine similarities.
+        """
+        tags = self._load_tags()
+        tag_ids = tags["tag_ids"]
+        if not tag_ids or not texts:
+            return tag_ids, np.zeros((len(texts), len(tag_ids)), dtype=np.float32)
+
+        features = [hash_features(text, self._n_features) for text in texts]
+        all_indices = np.concatenate([indices for indices, _ in features])
+        union, inverse = np.unique(all_indices, return_inverse=True)
+
+        batch = np.zeros((len(texts), union.size), dtype=np.float32)
+        rows = np.repeat(
+            np.arange(len(texts)), [indices.size for indices, _ in features]
+        )
+        batch[rows, inverse] = np.concatenate([values for _, values in features])
+
+        weights = np.load(self._weights_path, mmap_mode="r")
+        scores = batch @ weights[union, : len(tag_ids)]
+        norms = np.sqrt(np.load(self._sq_norms_path)[: len(tag_ids)])
+        np.divide(scores, norms, out=scores, where=norms > 0)
+        return tag_ids, scores
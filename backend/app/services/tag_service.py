@@ -0,0 +1,155 @@
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database import read_only
+from app.models.document import Document, DocumentTag
+from app.models.tag import Tag
+from app.services.tag_classifier import TagClassifier
+
+
+class TagService:
+    def __init__(self, session: Session, storage_dir: Path):
+        self._db = session
+        self._storage_dir = storage_dir
+
+    def _classifier(self, user_id: int) -> TagClassifier:
+        return TagClassifier(self._storage_dir / "models" / "tags" / str(user_id))
+
+    def _get_document(self, document_id: int) -> Document:
+        return self._db.execute(
+            select(Document).where(
+                Document.id == document_id, Document.deleted_at.is_(None)
+            )
+        ).scalar_one()
+
+    def assign_tag(
+        self,
+        document_id: int,
+        *,
+        user_id: int,
+        name: str,
+        color: str | None = None,
+    ) -> DocumentTag:
+        """Assign a tag to a document on behalf of a user.
+
+        The tag is created if it does not exist yet, and the document is added
+        to the user's tag suggestion model.
+
+        Args:
+            document_id (int): ID of the document to tag.
+            user_id (int): ID of the user assigning the tag.
+            name (str): Name of the tag.
+            color (str | None): Display color, e.g. ``"#ff0000"``.
+
+        Returns:
+            DocumentTag: The new assignment.
+
+        Raises:
+            NoResultFound: If no document with the given ID exists.
+            IntegrityError: If the user already assigned this tag to the document.
+        """
+        document = self._get_document(document_id)
+
+        tag = self._db.execute(select(Tag).where(Tag.name == name)).scalar_one_or_none()
+        if tag is None:
+            tag = Tag(name=name)
+            self._db.add(tag)
+
+        document_tag = DocumentTag(
+            document=document, tag=tag, user_id=user_id, color=color
+        )
+        self._db.add(document_tag)
+        self._db.commit()
+
+        self._classifier(user_id).learn(tag.id, document.text)
+        self._db.refresh(document_tag)
+        return document_tag
+
+    @read_only
+    def suggest_tags(
+        self,
+        document_id: int,
+        *,
+        user_id: int,
+        limit: int = 5,
+        min_score: float = 0.1,
+    ) -> list[tuple[Tag, float]]:
+        """Suggest tags for a document from the user's previous tagging.
+
+        Args:
+            document_id (int): ID of the document.
+            user_id (int): ID of the user the suggestions are for.
+            limit (int): Maximum number of suggestions.
+            min_score (float): Minimum cosine similarity to suggest a tag.
+
+        Returns:
+            list[tuple[Tag, float]]: Suggested tags and their scores, best
+                first. Tags the user already assigned are left out.
+
+        Raises:
+            NoResultFound: If no document with the given ID exists.
+        """
+        return self.suggest_tags_batch(
+            [document_id], user_id=user_id, limit=limit, min_score=min_score
+        )[document_id]
+
+    @read_only
+    def suggest_tags_batch(
+        self,
+        document_ids: Sequence[int],
+        *,
+        user_id: int,
+        limit: int = 5,
+        min_score: float = 0.1,
+    ) -> dict[int, list[tuple[Tag, float]]]:
+        """Suggest tags for several documents with a single scoring pass.
+
+        Meant for ingestion jobs that process many documents at once.
+
+        Args:
+            document_ids (Sequence[int]): IDs of the documents.
+            user_id (int): ID of the user the suggestions are for.
+            limit (int): Maximum number of suggestions per document.
+            min_score (float): Minimum cosine similarity to suggest a tag.
+
+        Returns:
+            dict[int, list[tuple[Tag, float]]]: Suggestions per document ID.
+
+        Raises:
+            NoResultFound: If any of the documents does not exist.
+        """
+        documents = [self._get_document(document_id) for document_id in document_ids]
+        tag_ids, scores = self._classifier(user_id).score(
+            [document.text for document in documents]
+        )
+        tags = {
+            tag.id: tag
+            for tag in self._db.execute(select(Tag).where(Tag.id.in_(tag_ids)))
+            .scalars()
+            .all()
+        }
+        assigned = set(
+            self._db.execute(
+                select(DocumentTag.document_id, DocumentTag.tag_id).where(
+                    DocumentTag.document_id.in_(document_ids),
+                    DocumentTag.user_id == user_id,
+                )
+            ).all()
+        )
+
+        suggestions = {}
+        for document, row in zip(documents, scores, strict=True):
+            ranked = []
+            for column in np.argsort(-row):
+                score = float(row[column])
+                if score < min_score or len(ranked) == limit:
+                    break
+                tag_id = tag_ids[column]
+                if tag_id in tags and (document.id, tag_id) not in assigned:
+                    ranked.append((tags[tag_id], score))
+            suggestions[document.id] = ranked
+        return suggestions
@@ -0,0 +1,388 @@
+import base64
+import binascii
+import hashlib
+import os
+import shutil
+import uuid
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path, PurePosixPath
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.document import Document, DocumentFile
+from app.models.upload import UploadSession, UploadSessionFile
+from app.models.user import User
+
+# Files whose contents are used as the document's extracted text.
+TEXT_EXTENSIONS = frozenset({".txt", ".md"})
+MAX_CONTENT_CHARS = 1_000_000
+
+
+class UploadError(Exception):
+    """Base class for errors raised while handling a resumable upload."""
+
+
+class UploadOffsetMismatchError(UploadError):
+    """The chunk does not start where the stored upload currently ends."""
+
+
+class UploadSizeExceededError(UploadError):
+    """The chunk would make the file larger than its declared size."""
+
+
+class UploadChecksumError(UploadError):
+    """The chunk checksum is malformed, unsupported or does not match."""
+
+
+class UploadLengthMismatchError(UploadError):
+    """The chunk body is shorter or longer than its declared length."""
+
+
+class UploadIncompleteError(UploadError):
+    """The session is finalized before every file is fully uploaded."""
+
+
+def _parse_checksum(checksum: str) -> tuple[str, bytes]:
+    algorithm, _, encoded = checksum.strip().partition(" ")
+    algorithm = algorithm.lower()
+    if algorithm not in hashlib.algorithms_guaranteed:
+        raise UploadChecksumError(f"Unsupported checksum algorithm: {algorithm}")
+    try:
+        return algorithm, base64.b64decode(encoded, validate=True)
+    except binascii.Error:
+        raise UploadChecksumError("Malformed checksum") from None
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _validate_filename(filename: str) -> None:
+    if filename in {".", ".."} or PurePosixPath(filename).name != filename:
+        raise ValueError(f"Invalid filename: {filename!r}")
+    if "\\" in filename:
+        raise ValueError(f"Invalid filename: {filename!r}")
+
+
+class UploadService:
+    def __init__(
+        self,
+        session: Session,
+        storage_dir: Path,
+        *,
+        session_ttl: timedelta = timedelta(hours=24),
+    ):
+        self._db = session
+        self._storage_dir = storage_dir
+        self._session_ttl = session_ttl
+
+    def _staging_dir(self, session_id: str) -> Path:
+        return self._storage_dir / "uploads" / session_id
+
+    def _staging_path(self, upload_file: UploadSessionFile) -> Path:
+        return self._staging_dir(upload_file.session_id) / str(upload_file.id)
+
+    def create_session(
+        self,
+        *,
+        user_id: int,
+        files: Sequence[tuple[str, int]],
+        title: str | None = None,
+        description: str | None = None,
+    ) -> UploadSession:
+        """Create a new upload session for a multi-file document.
+
+        Expired sessions are garbage-collected first.
+
+        Args:
+            user_id (int): ID of the user who will own the document.
+            files (Sequence[tuple[str, int]]): Filename and total size in bytes
+                of each file to upload.
+            title (str | None): Document title. Defaults to the name of the
+                first file.
+            description (str | None): Document description.
+
+        Returns:
+            UploadSession: The new session, with an empty staging file per file.
+
+        Raises:
+            NoResultFound: If no user with the given ID exists.
+            ValueError: If a filename is invalid or repeated.
+        """
+        self.purge_expired_sessions()
+        self._db.execute(
+            select(User.id).where(User.id == user_id, User.deleted_at.is_(None))
+        ).scalar_one()
+
+        filenames = [filename for filename, _ in files]
+        for filename in filenames:
+            _validate_filename(filename)
+        if len(set(filenames)) != len(filenames):
+            raise ValueError("Filenames must be unique within a document")
+
+        upload = UploadSession(
+            id=uuid.uuid4().hex,
+            user_id=user_id,
+            title=title,
+            description=description,
+            files=[
+                UploadSessionFile(filename=filename, size=size)
+                for filename, size in files
+            ],
+        )
+        self._db.add(upload)
+        self._db.commit()
+
+        self._staging_dir(upload.id).mkdir(parents=True, exist_ok=True)
+        for upload_file in upload.files:
+            self._staging_path(upload_file).touch()
+
+        return upload
+
+    def get_session(self, session_id: str) -> UploadSession:
+        """Get an upload session by ID.
+
+        Args:
+            session_id (str): ID of the session to retrieve.
+
+        Returns:
+            UploadSession: The matching session.
+
+        Raises:
+            NoResultFound: If no session with the given ID exists.
+        """
+        return self._db.execute(
+            select(UploadSession).where(UploadSession.id == session_id)
+        ).scalar_one()
+
+    def append_chunk(
+        self,
+        session_id: str,
+        file_id: int,
+        *,
+        offset: int,
+        data: bytes | Iterable[bytes],
+        length: int | None = None,
+        checksum: str | None = None,
+    ) -> UploadSessionFile:
+        """Write a chunk to the staging file of an upload.
+
+        Files of the same session can receive chunks concurrently. Chunks of
+        one file must be sent in order: ``offset`` has to match the number of
+        bytes already stored.
+
+        The chunk is first streamed into a part file of its own, without a
+        transaction or connection held, so a slow client never blocks other
+        writes. The range is then claimed with a conditional update of the
+        file's offset, so a concurrent request for the same offset fails
+        instead of overwriting the chunk, and the part file is copied into
+        the staging file before the claim is committed. If the copy fails,
+        the claim is rolled back and the staging file truncated to
+        ``offset``.
+
+        Args:
+            session_id (str): ID of the upload session.
+            file_id (int): ID of the file within the session.
+            offset (int): Position of the chunk within the file.
+            data (bytes | Iterable[bytes]): Chunk contents, either whole or
+                as a stream of parts written as they arrive.
+            length (int | None): Declared length of the chunk. Required when
+                ``data`` is a stream.
+            checksum (str | None): ``"<algorithm> <base64 digest>"`` of the
+                chunk.
+
+        Returns:
+            UploadSessionFile: The file, with its updated offset.
+
+        Raises:
+            NoResultFound: If the session or file does not exist.
+            UploadOffsetMismatchError: If ``offset`` is not the current offset.
+            UploadSizeExceededError: If the chunk exceeds the declared size.
+            UploadLengthMismatchError: If the stream does not match ``length``.
+            UploadChecksumError: If the checksum does not match the chunk.
+        """
+        if isinstance(data, bytes):
+            length = len(data)
+            data = [data]
+        elif length is None:
+            raise ValueError("length is required when streaming a chunk")
+
+        upload_file = self._db.execute(
+            select(UploadSessionFile).where(
+                UploadSessionFile.id == file_id,
+                UploadSessionFile.session_id == session_id,
+            )
+        ).scalar_one()
+
+        if offset != upload_file.offset:
+            raise UploadOffsetMismatchError(
+                f"Expected offset {upload_file.offset}, got {offset}"
+            )
+        if offset + length > upload_file.size:
+            raise UploadSizeExceededError("Chunk exceeds the declared file size")
+        if checksum is not None:
+            algorithm, expected = _parse_checksum(checksum)
+            digest = hashlib.new(algorithm)
+
+        staging_path = self._staging_path(upload_file)
+        part_path = staging_path.with_name(
+            f"{staging_path.name}.{uuid.uuid4().hex}.part"
+        )
+        # Nothing may be held while the body arrives.
+        self._db.commit()
+
+        try:
+            written = 0
+            with part_path.open("wb") as part_file:
+                for part in data:
+                    written += len(part)
+                    if written > length:
+                        raise UploadLengthMismatchError(
+                            "Chunk is longer than its declared length"
+                        )
+                    part_file.write(part)
+                    if checksum is not None:
+                        digest.update(part)
+            if written != length:
+                raise UploadLengthMismatchError(
+                    "Chunk is shorter than its declared length"
+                )
+            if checksum is not None and digest.digest() != expected:
+                raise UploadChecksumError("Checksum mismatch")
+
+            # Claim the range: only one request can move the offset forward.
+            result = self._db.execute(
+                update(UploadSessionFile)
+                .where(
+                    UploadSessionFile.id == file_id,
+                    UploadSessionFile.offset == offset,
+                )
+                .values(offset=offset + length)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != 1:
+                self._db.rollback()
+                raise UploadOffsetMismatchError("Concurrent write to the same file")
+
+            try:
+                with (
+                    part_path.open("rb") as part_file,
+                    staging_path.open("r+b") as staging,
+                ):
+                    staging.seek(offset)
+                    shutil.copyfileobj(part_file, staging)
+                self._db.execute(
+                    update(UploadSession)
+                    .where(UploadSession.id == session_id)
+                    .values(updated_at=datetime.now(UTC))
+                    .execution_options(synchronize_session=False)
+                )
+                self._db.commit()
+            except Exception:
+                self._db.rollback()
+                os.truncate(staging_path, offset)
+                raise
+        finally:
+            part_path.unlink(missing_ok=True)
+
+        self._db.refresh(upload_file)
+        return upload_file
+
+    def finalize(self, session_id: str) -> Document:
+        """Turn a fully uploaded session into a document.
+
+        Staging files are moved into the document's storage directory and the
+        session is removed. Plain text files become the document's content.
+
+        Args:
+            session_id (str): ID of the upload session.
+
+        Returns:
+            Document: The newly created document, with one file per upload.
+
+        Raises:
+            NoResultFound: If no session with the given ID exists.
+            UploadIncompleteError: If any file is not fully uploaded.
+        """
+        upload = self.get_session(session_id)
+        if not all(upload_file.complete for upload_file in upload.files):
+            raise UploadIncompleteError("Not every file has been fully uploaded")
+
+        document = Document(
+            user_id=upload.user_id,
+            title=upload.title or PurePosixPath(upload.files[0].filename).stem,
+            description=upload.description,
+        )
+        self._db.add(document)
+        self._db.flush()
+
+        content = []
+        for upload_file in upload.files:
+            path = PurePosixPath("documents", str(document.id), upload_file.filename)
+            target = self._storage_dir / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            staging = self._staging_path(upload_file)
+            # Drop any bytes past the declared size left by an interrupted write.
+            os.truncate(staging, upload_file.size)
+            os.replace(staging, target)
+            document.files.append(
+                DocumentFile(
+                    path=str(path),
+                    size=upload_file.size,
+                    sha256=_file_sha256(target),
+                )
+            )
+            if path.suffix.lower() in TEXT_EXTENSIONS:
+                with target.open(encoding="utf-8", errors="replace") as text:
+                    content.append(text.read(MAX_CONTENT_CHARS))
+
+        document.content = "\n".join(content) or None
+
+        self._db.delete(upload)
+        self._db.commit()
+        shutil.rmtree(self._staging_dir(session_id), ignore_errors=True)
+
+        self._db.refresh(document)
+        return document
+
+    def abort(self, session_id: str) -> None:
+        """Delete an upload session and its staging files.
+
+        Args:
+            session_id (str): ID of the upload session.
+
+        Raises:
+            NoResultFound: If no session with the given ID exists.
+        """
+        upload = self.get_session(session_id)
+        self._db.delete(upload)
+        self._db.commit()
+        shutil.rmtree(self._staging_dir(session_id), ignore_errors=True)
+
+    def purge_expired_sessions(self) -> int:
+        """Delete sessions that have not received a chunk within the TTL.
+
+        Returns:
+            int: Number of sessions deleted.
+        """
+        cutoff = datetime.now(UTC) - self._session_ttl
+        expired = (
+            self._db.execute(
+                select(UploadSession).where(UploadSession.updated_at < cutoff)
+            )
+            .scalars()
+            .all()
+        )
+        for upload in expired:
+            self._db.delete(upload)
+        self._db.commit()
+
+        for upload in expired:
+            shutil.rmtree(self._staging_dir(upload.id), ignore_errors=True)
+        return len(expired)
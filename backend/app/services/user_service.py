@@ -1,6 +1,10 @@
-from sqlalchemy import select
+from datetime import UTC, datetime
+
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
+from app.database import read_only
+from app.models.document import Document
 from app.models.user import User
 
 
@@ -8,8 +12,9 @@ class UserService:
     def __init__(self, session: Session):
         self._db = session
 
+    @read_only
     def list_users(self) -> list[User]:
-        """List all users.
+        """List all users that have not been deleted.
 
         Args:
             session (Session): The database session.
@@ -17,8 +22,21 @@ class UserService:
         Returns:
             list[User]: A list of all users.
         """
-        return self._db.execute(select(User)).scalars().all()
-
+        return (
+            self._db.execute(
+                select(User).where(User.deleted_at.is_(None)).order_by(User.id)
+            )
+            .scalars()
+            .all()
+        )
+
+    def _get_user(self, user_id: int) -> User:
+        # Writes load the user from the primary, never from a lagging replica.
+        return self._db.execute(
+            select(User).where(User.id == user_id, User.deleted_at.is_(None))
+        ).scalar_one()
+
+    @read_only
     def get_user(self, user_id: int) -> User:
         """Get a user by ID.
 
@@ -30,9 +48,9 @@ class UserService:
             User: The matching user.
 
         Raises:
-            NoResultFound: If no user with the given ID exists.
+            NoResultFound: If no user with the given ID exists or it was deleted.
         """
-        return self._db.execute(select(User).where(User.id == user_id)).scalar_one()
+        return self._get_user(user_id)
 
     def create_user(
         self,
@@ -84,7 +102,7 @@ class UserService:
             NoResultFound: If no user with the given ID exists.
             IntegrityError: If an user with the same email or username already exists.
         """
-        user = self.get_user(user_id)
+        user = self._get_user(user_id)
 
         if email is not None:
             user.email = email
@@ -98,15 +116,23 @@ class UserService:
         return user
 
     def delete_user(self, user_id: int) -> None:
-        """Delete an existing user.
+        """Soft-delete an existing user and their documents.
+
+        The rows are only hidden; a purge job removes them afterwards.
 
         Args:
             session (Session): Database session.
-            user_id (int): ID of the user to update.
+            user_id (int): ID of the user to delete.
 
         Raises:
             NoResultFound: If no user with the given ID exists.
         """
-        user = self.get_user(user_id)
-        self._db.delete(user)
+        user = self._get_user(user_id)
+        now = datetime.now(UTC)
+        user.deleted_at = now
+        self._db.execute(
+            update(Document)
+            .where(Document.user_id == user.id, Document.deleted_at.is_(None))
+            .values(deleted_at=now)
+        )
         self._db.commit()
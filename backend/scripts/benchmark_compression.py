@@ -0,0 +1,106 @@
+"""Measure CPU cost vs. bytes saved for each response encoding and level.
+
+The second table streams NDJSON one line per message, as a
+``StreamingResponse`` does, and compares flushing the compressor after every
+line with flushing every ``flush_size`` bytes and with a single final flush.
+
+Usage:
+    uv run python -m scripts.benchmark_compression
+"""
+
+import json
+import time
+
+from app.middleware.compression import available_compressors
+
+
+def sample_payloads() -> dict[str, bytes]:
+    users = [
+        {"id": i, "username": f"user{i}", "email": f"user{i}@example.com"}
+        for i in range(5_000)
+    ]
+    text = " ".join(
+        f"Invoice {i} issued to customer {i % 97} for the amount of {i * 3.5:.2f}"
+        for i in range(5_000)
+    )
+    ndjson = "".join(json.dumps(user) + "\n" for user in users)
+    return {
+        "users.json": json.dumps(users).encode(),
+        "extracted.txt": text.encode(),
+        "users.ndjson": ndjson.encode(),
+    }
+
+
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 8, 11), "zstd": (1, 3, 9, 19)}
+STREAM_LEVELS = {"gzip": 6, "br": 4, "zstd": 3}
+FLUSH_SIZES = {"every line": 0, "8 KiB": 8 * 1024, "16 KiB": 16 * 1024, "never": None}
+
+
+def benchmark(payload: bytes, encoding: str, level: int, rounds: int = 5):
+    factory = available_compressors()[encoding]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        compressor = factory(level)
+        data = compressor.compress(payload) + compressor.finish()
+    elapsed = (time.perf_counter() - start) / rounds
+    return len(data), elapsed
+
+
+def benchmark_stream(
+    lines: list[bytes],
+    encoding: str,
+    level: int,
+    flush_size: int | None,
+    rounds: int = 5,
+):
+    """Compress ``lines`` one at a time, flushing every ``flush_size`` bytes.
+
+    ``flush_size=None`` never flushes before the end of the stream.
+    """
+    factory = available_compressors()[encoding]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        compressor = factory(level)
+        size = unflushed = 0
+        for line in lines:
+            size += len(compressor.compress(line))
+            unflushed += len(line)
+            if flush_size is not None and unflushed >= flush_size:
+                size += len(compressor.flush())
+                unflushed = 0
+        size += len(compressor.finish())
+    elapsed = (time.perf_counter() - start) / rounds
+    return size, elapsed
+
+
+def main() -> None:
+    print(
+        f"{'payload':<14}{'encoding':<10}{'level':>6}{'ratio':>8}{'ms':>9}{'MB/s':>9}"
+    )
+    for name, payload in sample_payloads().items():
+        for encoding in available_compressors():
+            for level in LEVELS[encoding]:
+                size, elapsed = benchmark(payload, encoding, level)
+                print(
+                    f"{name:<14}{encoding:<10}{level:>6}"
+                    f"{size / len(payload):>8.3f}"
+                    f"{elapsed * 1000:>9.2f}"
+                    f"{len(payload) / elapsed / 1e6:>9.1f}"
+                )
+
+    lines = sample_payloads()["users.ndjson"].splitlines(keepends=True)
+    payload_size = sum(map(len, lines))
+    print()
+    print(f"{'streamed NDJSON':<16}{'flush':<12}{'bytes':>9}{'ratio':>8}{'ms':>9}")
+    for encoding, level in STREAM_LEVELS.items():
+        for label, flush_size in FLUSH_SIZES.items():
+            size, elapsed = benchmark_stream(lines, encoding, level, flush_size)
+            print(
+                f"{f'{encoding} {level}':<16}{label:<12}{size:>9}"
+                f"{size / payload_size:>8.3f}"
+                f"{elapsed * 1000:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure tag suggestion latency for a single document and for batches.
+
+Usage:
+    uv run python -m scripts.benchmark_tag_suggestions
+"""
+
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.tag_classifier import TagClassifier
+
+N_TAGS = 200
+EXAMPLES_PER_TAG = 10
+WORDS_PER_DOCUMENT = 500
+
+
+def random_document(rng: random.Random, vocabulary: list[str]) -> str:
+    return " ".join(rng.choices(vocabulary, k=WORDS_PER_DOCUMENT))
+
+
+def main() -> None:
+    rng = random.Random(0)
+    vocabulary = [f"word{i}" for i in range(20_000)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        classifier = TagClassifier(Path(tmp))
+
+        start = time.perf_counter()
+        for tag_id in range(N_TAGS):
+            for _ in range(EXAMPLES_PER_TAG):
+                classifier.learn(tag_id, random_document(rng, vocabulary))
+        elapsed = time.perf_counter() - start
+        print(f"learn: {elapsed / (N_TAGS * EXAMPLES_PER_TAG) * 1000:.2f} ms/example")
+
+        timings = []
+        for _ in range(200):
+            text = random_document(rng, vocabulary)
+            start = time.perf_counter()
+            classifier.score([text])
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        print(
+            f"score 1 document ({N_TAGS} tags): "
+            f"p50 {statistics.median(timings):.2f} ms, "
+            f"p99 {timings[int(len(timings) * 0.99)]:.2f} ms"
+        )
+
+        for batch_size in (10, 100):
+            texts = [random_document(rng, vocabulary) for _ in range(batch_size)]
+            start = time.perf_counter()
+            classifier.score(texts)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(
+                f"score batch of {batch_size}: {elapsed:.2f} ms "
+                f"({elapsed / batch_size:.2f} ms/document)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Run purge jobs that were interrupted (e.g. by a restart) or failed.
+
+Purge jobs normally run in the API process right after a delete request;
+run this periodically (e.g. from cron) so that none is left behind.
+
+Usage:
+    uv run python -m scripts.resume_purge_jobs
+"""
+
+from datetime import timedelta
+from pathlib import Path
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.purge_service import PurgeService
+
+
+def main() -> None:
+    with SessionLocal() as session:
+        service = PurgeService(
+            session,
+            Path(settings.storage_dir),
+            batch_size=settings.purge_batch_size,
+        )
+        jobs = service.resume_jobs(
+            stale_after=timedelta(minutes=settings.purge_stale_after_minutes)
+        )
+
+    for job in jobs:
+        print(
+            f"job {job.id} ({job.entity_type} {job.entity_id}): {job.status}, "
+            f"{job.processed}/{job.total} documents"
+        )
+    print(f"{len(jobs)} job(s) resumed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.documents import router as documents_router
+from app.api.users import router as users_router
+from app.services.purge_service import PurgeService
+from tests.factories import add_document
+
+# --- Helpers
+BASE_URL = documents_router.prefix
+
+
+@pytest.fixture
+def base_user(client: TestClient):
+    response = client.post(
+        f"{users_router.prefix}/",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "password123",
+        },
+    )
+    return response.json()
+
+
+@pytest.fixture
+def document(db_session: Session, storage_dir: Path, base_user):
+    return add_document(
+        db_session,
+        storage_dir,
+        base_user["id"],
+        title="Invoice",
+        content="power invoice",
+        files={"invoice.txt": b"power invoice"},
+    )
+
+
+# --- GET /v1/documents/{document_id}
+def test_get_document_returns_200(client: TestClient, document):
+
+    response = client.get(f"{BASE_URL}/{document.id}")
+
+    assert response.status_code == 200
+    assert response.json()["title"] == document.title
+
+
+def test_get_document_returns_404_when_not_found(client: TestClient):
+    response = client.get(f"{BASE_URL}/999")
+
+    assert response.status_code == 404
+
+
+# --- DELETE /v1/documents/{document_id}
+def test_delete_document_returns_202_with_purge_job(client: TestClient, document):
+
+    response = client.delete(f"{BASE_URL}/{document.id}")
+    data = response.json()
+
+    assert response.status_code == 202
+    assert data["entity_type"] == "document"
+    assert data["total"] == 1
+
+
+def test_delete_document_hides_document(client: TestClient, document):
+    document_id = document.id
+
+    client.delete(f"{BASE_URL}/{document_id}")
+    response = client.get(f"{BASE_URL}/{document_id}")
+
+    assert response.status_code == 404
+
+
+def test_delete_document_purges_files(client: TestClient, storage_dir: Path, document):
+    document_id = document.id
+
+    job = client.delete(f"{BASE_URL}/{document_id}").json()
+    job = client.get(f"/v1/purge-jobs/{job['id']}").json()
+
+    assert job["status"] == "completed"
+    assert job["processed"] == 1
+    assert not (storage_dir / "documents" / str(document_id)).exists()
+
+
+def test_delete_document_does_not_wait_for_purge(
+    threaded_client: TestClient,
+    threaded_session_factory: sessionmaker[Session],
+    storage_dir: Path,
+    purge_executor: ThreadPoolExecutor,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    client = threaded_client
+    release = threading.Event()
+    released = []
+    run = PurgeService.run
+
+    def blocked_run(self, job_id):
+        released.append(release.wait(timeout=5))
+        return run(self, job_id)
+
+    monkeypatch.setattr(PurgeService, "run", blocked_run)
+    user = client.post(
+        f"{users_router.prefix}/",
+        json={"email": "t@example.com", "username": "t", "password": "pw"},
+    ).json()
+    with threaded_session_factory() as session:
+        document_id = add_document(session, storage_dir, user["id"]).id
+        session.commit()
+
+    # The purge is still blocked when the response arrives.
+    job = client.delete(f"{BASE_URL}/{document_id}").json()
+    release.set()
+    purge_executor.shutdown()
+
+    assert released == [True]
+    assert job["status"] == "pending"
+    job = client.get(f"/v1/purge-jobs/{job['id']}").json()
+    assert job["status"] == "completed"
+
+
+def test_delete_document_returns_404_when_not_found(client: TestClient):
+    response = client.delete(f"{BASE_URL}/999")
+
+    assert response.status_code == 404
+
+
+# --- POST /v1/documents/{document_id}/tags
+def test_assign_tag_returns_201(client: TestClient, base_user, document):
+
+    response = client.post(
+        f"{BASE_URL}/{document.id}/tags",
+        json={"user_id": base_user["id"], "name": "utilities", "color": "#123abc"},
+    )
+    data = response.json()
+
+    assert response.status_code == 201
+    assert data["tag"]["name"] == "utilities"
+    assert data["color"] == "#123abc"
+
+
+def test_assign_tag_returns_404_when_not_found(client: TestClient, base_user):
+    response = client.post(
+        f"{BASE_URL}/999/tags", json={"user_id": base_user["id"], "name": "x"}
+    )
+
+    assert response.status_code == 404
+
+
+def test_assign_tag_returns_409_on_duplicate(client: TestClient, base_user, document):
+    payload = {"user_id": base_user["id"], "name": "utilities"}
+    client.post(f"{BASE_URL}/{document.id}/tags", json=payload)
+
+    response = client.post(f"{BASE_URL}/{document.id}/tags", json=payload)
+
+    assert response.status_code == 409
+
+
+# --- GET /v1/documents/{document_id}/tag-suggestions
+def test_suggest_tags_returns_learned_tags(
+    client: TestClient, db_session: Session, storage_dir: Path, base_user
+):
+    tagged = add_document(
+        db_session, storage_dir, base_user["id"], content="power invoice kwh meter"
+    )
+    untagged = add_document(
+        db_session, storage_dir, base_user["id"], content="kwh power invoice"
+    )
+    client.post(
+        f"{BASE_URL}/{tagged.id}/tags",
+        json={"user_id": base_user["id"], "name": "utilities"},
+    )
+
+    response = client.get(
+        f"{BASE_URL}/{untagged.id}/tag-suggestions",
+        params={"user_id": base_user["id"]},
+    )
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data[0]["tag"]["name"] == "utilities"
+    assert 0 < data[0]["score"] <= 1
+
+
+def test_suggest_tags_returns_404_when_not_found(client: TestClient, base_user):
+    response = client.get(
+        f"{BASE_URL}/999/tag-suggestions", params={"user_id": base_user["id"]}
+    )
+
+    assert response.status_code == 404
+
+
+# --- GET /v1/documents/{document_id}/duplicates
+def test_list_duplicates_returns_200(
+    client: TestClient, db_session: Session, storage_dir: Path, base_user
+):
+    original = add_document(
+        db_session, storage_dir, base_user["id"], files={"scan.pdf": b"scan"}
+    )
+    copy = add_document(
+        db_session, storage_dir, base_user["id"], files={"scan.pdf": b"scan"}
+    )
+
+    response = client.get(f"{BASE_URL}/{copy.id}/duplicates")
+
+    assert response.status_code == 200
+    assert response.json()[0]["document_id"] == original.id
+
+
+# --- POST /v1/documents/{document_id}/merge
+def test_merge_documents_returns_merged_document(
+    client: TestClient, db_session: Session, storage_dir: Path, base_user
+):
+    original = add_document(
+        db_session, storage_dir, base_user["id"], files={"scan.pdf": b"scan"}
+    )
+    copy = add_document(
+        db_session, storage_dir, base_user["id"], files={"scan.pdf": b"scan"}
+    )
+
+    response = client.post(
+        f"{BASE_URL}/{original.id}/merge",
+        json={"source_document_id": copy.id},
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["files"]) == 1
+    assert client.get(f"{BASE_URL}/{original.id}/duplicates").json() == []
+
+
+def test_merge_documents_returns_404_when_not_found(client: TestClient, document):
+
+    response = client.post(
+        f"{BASE_URL}/{document.id}/merge", json={"source_document_id": 999}
+    )
+
+    assert response.status_code == 404
+
+
+def test_merge_documents_returns_422_on_same_document(client: TestClient, document):
+
+    response = client.post(
+        f"{BASE_URL}/{document.id}/merge",
+        json={"source_document_id": document.id},
+    )
+
+    assert response.status_code == 422
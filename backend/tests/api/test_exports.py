@@ -0,0 +1,88 @@
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.exports import router as exports_router
+from app.api.users import router as users_router
+from app.models.document import DocumentTag
+from app.models.tag import Tag
+from tests.factories import add_document
+
+# --- Helpers
+BASE_URL = exports_router.prefix
+
+
+@pytest.fixture
+def base_user(client: TestClient):
+    response = client.post(
+        f"{users_router.prefix}/",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "password123",
+        },
+    )
+    return response.json()
+
+
+# --- GET /v1/exports/documents/{document_id}
+def test_export_document_streams_zip(
+    client: TestClient, db_session: Session, storage_dir: Path, base_user
+):
+    document = add_document(
+        db_session,
+        storage_dir,
+        base_user["id"],
+        files={"a.pdf": b"pdf", "b.txt": b"text"},
+    )
+
+    response = client.get(f"{BASE_URL}/documents/{document.id}")
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/zip"
+    assert "document-" in response.headers["Content-Disposition"]
+    assert archive.read(f"{document.id}/b.txt") == b"text"
+
+
+def test_export_document_returns_404_when_not_found(client: TestClient):
+    response = client.get(f"{BASE_URL}/documents/999")
+
+    assert response.status_code == 404
+
+
+# --- GET /v1/exports/tags/{tag_name}
+def test_export_tag_returns_404_on_unknown_tag(client: TestClient):
+    response = client.get(f"{BASE_URL}/tags/missing", params={"user_id": 1})
+
+    assert response.status_code == 404
+
+
+def test_export_tag_streams_documents_from_the_request_session(
+    threaded_client: TestClient,
+    threaded_session_factory: sessionmaker[Session],
+    storage_dir: Path,
+):
+    client = threaded_client
+    user = client.post(
+        f"{users_router.prefix}/",
+        json={"email": "t@example.com", "username": "t", "password": "pw"},
+    ).json()
+    with threaded_session_factory() as session:
+        document = add_document(
+            session, storage_dir, user["id"], files={"bill.pdf": b"pdf"}
+        )
+        session.add(
+            DocumentTag(document=document, tag=Tag(name="bills"), user_id=user["id"])
+        )
+        session.commit()
+
+    response = client.get(f"{BASE_URL}/tags/bills", params={"user_id": user["id"]})
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+
+    assert response.status_code == 200
+    assert archive.read(f"{document.id}/bill.pdf") == b"pdf"
@@ -0,0 +1,13 @@
+from fastapi.testclient import TestClient
+
+from app.api.purge_jobs import router as purge_jobs_router
+
+# --- Helpers
+BASE_URL = purge_jobs_router.prefix
+
+
+# --- GET /v1/purge-jobs/{job_id}
+def test_get_purge_job_returns_404_when_not_found(client: TestClient):
+    response = client.get(f"{BASE_URL}/999")
+
+    assert response.status_code == 404
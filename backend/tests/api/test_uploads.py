@@ -0,0 +1,268 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.uploads import router as uploads_router
+from app.api.users import router as users_router
+from app.config import settings
+from tests.factories import add_document
+
+# --- Helpers
+BASE_URL = uploads_router.prefix
+
+
+def send_chunk(client: TestClient, session_id, file_id, offset, data, **headers):
+    return client.patch(
+        f"{BASE_URL}/{session_id}/files/{file_id}",
+        content=data,
+        headers={
+            "Content-Type": "application/offset+octet-stream",
+            "Upload-Offset": str(offset),
+            **headers,
+        },
+    )
+
+
+@pytest.fixture
+def base_user(client: TestClient):
+    response = client.post(
+        f"{users_router.prefix}/",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "password123",
+        },
+    )
+    return response.json()
+
+
+@pytest.fixture
+def upload(client: TestClient, base_user):
+    response = client.post(
+        f"{BASE_URL}/",
+        json={
+            "user_id": base_user["id"],
+            "title": "Scan",
+            "files": [
+                {"filename": "page1.jpg", "size": 6},
+                {"filename": "page2.jpg", "size": 3},
+            ],
+        },
+    )
+    return response.json()
+
+
+# --- POST /v1/uploads/
+def test_create_upload_returns_201(client: TestClient, upload):
+    assert upload["id"]
+    assert [file["offset"] for file in upload["files"]] == [0, 0]
+
+
+def test_create_upload_returns_404_on_unknown_user(client: TestClient):
+    response = client.post(
+        f"{BASE_URL}/",
+        json={"user_id": 999, "files": [{"filename": "a.pdf", "size": 1}]},
+    )
+
+    assert response.status_code == 404
+
+
+def test_create_upload_returns_422_on_invalid_filename(client: TestClient, base_user):
+    response = client.post(
+        f"{BASE_URL}/",
+        json={
+            "user_id": base_user["id"],
+            "files": [{"filename": "../a.pdf", "size": 1}],
+        },
+    )
+
+    assert response.status_code == 422
+
+
+# --- GET /v1/uploads/{session_id}
+def test_get_upload_reports_offsets(client: TestClient, upload):
+    file_id = upload["files"][0]["id"]
+    send_chunk(client, upload["id"], file_id, 0, b"abc")
+
+    response = client.get(f"{BASE_URL}/{upload['id']}")
+
+    assert response.status_code == 200
+    assert response.json()["files"][0]["offset"] == 3
+
+
+def test_get_upload_returns_404_when_not_found(client: TestClient):
+    response = client.get(f"{BASE_URL}/missing")
+
+    assert response.status_code == 404
+
+
+# --- PATCH /v1/uploads/{session_id}/files/{file_id}
+def test_upload_chunk_returns_new_offset(client: TestClient, upload):
+    file_id = upload["files"][0]["id"]
+
+    response = send_chunk(client, upload["id"], file_id, 0, b"abc")
+
+    assert response.status_code == 200
+    assert response.headers["Upload-Offset"] == "3"
+    assert response.json()["offset"] == 3
+
+
+def test_upload_chunk_returns_409_on_offset_mismatch(client: TestClient, upload):
+    file_id = upload["files"][0]["id"]
+
+    response = send_chunk(client, upload["id"], file_id, 2, b"abc")
+
+    assert response.status_code == 409
+
+
+def test_upload_chunk_returns_400_on_checksum_mismatch(client: TestClient, upload):
+    file_id = upload["files"][0]["id"]
+
+    response = send_chunk(
+        client,
+        upload["id"],
+        file_id,
+        0,
+        b"abc",
+        **{"Upload-Checksum": "sha256 AAAA"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_upload_chunk_returns_413_when_exceeding_size(client: TestClient, upload):
+    file_id = upload["files"][1]["id"]
+
+    response = send_chunk(client, upload["id"], file_id, 0, b"abcdef")
+
+    assert response.status_code == 413
+
+
+def test_upload_chunk_returns_413_before_reading_large_chunk(
+    client: TestClient, upload, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "upload_max_chunk_size", 2)
+    file_id = upload["files"][0]["id"]
+
+    response = send_chunk(client, upload["id"], file_id, 0, b"abc")
+
+    assert response.status_code == 413
+    assert client.get(f"{BASE_URL}/{upload['id']}").json()["files"][0]["offset"] == 0
+
+
+def test_upload_chunk_returns_411_without_content_length(client: TestClient, upload):
+    file_id = upload["files"][0]["id"]
+
+    # A generator body is sent with chunked transfer encoding.
+    response = send_chunk(client, upload["id"], file_id, 0, iter([b"abc"]))
+
+    assert response.status_code == 411
+
+
+# --- POST /v1/uploads/{session_id}/finalize
+def test_finalize_upload_returns_document(client: TestClient, upload):
+    first, second = upload["files"]
+    send_chunk(client, upload["id"], first["id"], 0, b"abc")
+    send_chunk(client, upload["id"], second["id"], 0, b"xyz")
+    send_chunk(client, upload["id"], first["id"], 3, b"def")
+
+    response = client.post(f"{BASE_URL}/{upload['id']}/finalize")
+    data = response.json()
+
+    assert response.status_code == 201
+    assert data["title"] == "Scan"
+    assert [file["filename"] for file in data["files"]] == ["page1.jpg", "page2.jpg"]
+    assert [file["size"] for file in data["files"]] == [6, 3]
+
+
+def test_finalize_upload_flags_possible_duplicates(
+    client: TestClient, db_session: Session, storage_dir: Path, base_user, upload
+):
+    original = add_document(
+        db_session, storage_dir, base_user["id"], files={"scan.jpg": b"abcdef"}
+    )
+    first, second = upload["files"]
+    send_chunk(client, upload["id"], first["id"], 0, b"abcdef")
+    send_chunk(client, upload["id"], second["id"], 0, b"xyz")
+
+    response = client.post(f"{BASE_URL}/{upload['id']}/finalize")
+
+    assert response.json()["possible_duplicates"] == [
+        {"document_id": original.id, "title": "Document", "similarity": 1.0}
+    ]
+
+
+def test_finalize_upload_returns_409_when_incomplete(client: TestClient, upload):
+    response = client.post(f"{BASE_URL}/{upload['id']}/finalize")
+
+    assert response.status_code == 409
+
+
+def test_files_upload_in_parallel(threaded_client: TestClient):
+    client = threaded_client
+    user = client.post(
+        f"{users_router.prefix}/",
+        json={"email": "t@example.com", "username": "t", "password": "pw"},
+    ).json()
+    contents = [bytes([i]) * 6 for i in range(4)]
+    files = [{"filename": f"page{i}.jpg", "size": 6} for i in range(4)]
+    upload = client.post(
+        f"{BASE_URL}/", json={"user_id": user["id"], "files": files}
+    ).json()
+
+    def upload_file(file, content):
+        return [
+            send_chunk(client, upload["id"], file["id"], offset, content[offset:][:3])
+            for offset in (0, 3)
+        ]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = executor.map(upload_file, upload["files"], contents)
+        statuses = [response.status_code for chunks in results for response in chunks]
+
+    assert statuses == [200] * 8
+    response = client.post(f"{BASE_URL}/{upload['id']}/finalize")
+    assert response.status_code == 201
+    document = response.json()
+    assert [file["size"] for file in document["files"]] == [6] * 4
+
+
+def test_concurrent_chunks_at_same_offset_write_once(
+    threaded_client: TestClient, storage_dir
+):
+    client = threaded_client
+    user = client.post(
+        f"{users_router.prefix}/",
+        json={"email": "t@example.com", "username": "t", "password": "pw"},
+    ).json()
+    upload = client.post(
+        f"{BASE_URL}/",
+        json={"user_id": user["id"], "files": [{"filename": "a.txt", "size": 3}]},
+    ).json()
+    file_id = upload["files"][0]["id"]
+    chunks = [bytes([ord("a") + i]) * 3 for i in range(4)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(
+            executor.map(
+                lambda chunk: send_chunk(client, upload["id"], file_id, 0, chunk),
+                chunks,
+            )
+        )
+
+    statuses = sorted(response.status_code for response in responses)
+    assert statuses == [200, 409, 409, 409]
+    winner = chunks[[r.status_code for r in responses].index(200)]
+    staging = storage_dir / "uploads" / upload["id"] / str(file_id)
+    assert staging.read_bytes() == winner
+
+
+# --- DELETE /v1/uploads/{session_id}
+def test_abort_upload_returns_204(client: TestClient, upload):
+    response = client.delete(f"{BASE_URL}/{upload['id']}")
+
+    assert response.status_code == 204
+    assert client.get(f"{BASE_URL}/{upload['id']}").status_code == 404
@@ -150,10 +150,30 @@ def test_update_user_returns_409_on_duplicate_email(client: TestClient, base_use
 
 
 # --- DELETE /v1/users/{user_id}
-def test_delete_user_returns_204(client: TestClient, base_user):
+def test_delete_user_returns_202_with_purge_job(client: TestClient, base_user):
     response = client.delete(f"{BASE_URL}/{base_user['id']}")
+    data = response.json()
+
+    assert response.status_code == 202
+    assert data["entity_type"] == "user"
+    assert data["entity_id"] == base_user["id"]
+
+
+def test_delete_user_purge_job_completes(client: TestClient, base_user):
+    job = client.delete(f"{BASE_URL}/{base_user['id']}").json()
+
+    response = client.get(f"/v1/purge-jobs/{job['id']}")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
 
-    assert response.status_code == 204
+
+def test_delete_user_releases_email_and_username(client: TestClient, base_user):
+    client.delete(f"{BASE_URL}/{base_user['id']}")
+
+    response = client.post(f"{BASE_URL}/", json=create_user_payload())
+
+    assert response.status_code == 201
 
 
 def test_delete_user_removes_user(client: TestClient, base_user):
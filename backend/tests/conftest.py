@@ -1,47 +1,147 @@
+import contextlib
+import hashlib
+import os
+import shutil
 from collections.abc import Generator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 from alembic.config import Config
 from fastapi.testclient import TestClient
-from sqlalchemy import Engine, StaticPool, create_engine
-from sqlalchemy.orm import Session
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
 
 from alembic import command
-from app.database import Base, get_db
-from app.main import app
+from app.api.dependencies import (
+    get_purge_executor,
+    get_session_factory,
+    get_storage_dir,
+)
+from app.database import MonitoredQueuePool, ReplicaPool, RoutingSession, get_db
+from app.main import app, rate_limit_backend
 
-TEST_DATABASE_URL = "sqlite:///:memory:"
+BACKEND_DIR = Path(__file__).parent.parent
+ALEMBIC_INI = BACKEND_DIR / "alembic.ini"
 
 
-def run_migrations(connection):
-    alembic_cfg = Config(str(Path(__file__).parent.parent / "alembic.ini"))
-    alembic_cfg.set_main_option("sqlalchemy.url", TEST_DATABASE_URL)
-    alembic_cfg.attributes["connection"] = connection
-    command.upgrade(alembic_cfg, "head")
+def schema_hash() -> str:
+    """Hash every input of the migrated schema.
 
+    The template database is rebuilt only when a migration (or the Alembic
+    environment) changes.
+    """
+    digest = hashlib.sha256()
+    sources = [BACKEND_DIR / "alembic" / "env.py"]
+    sources += sorted((BACKEND_DIR / "alembic" / "versions").glob("*.py"))
+    for path in sources:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
 
-@pytest.fixture(scope="session")
-def db_engine() -> Generator[Engine]:
-    engine = create_engine(
-        TEST_DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
 
+def sqlite_url(path: Path) -> str:
+    return f"sqlite:///{path}"
+
+
+def create_test_engine(path: Path) -> Engine:
+    engine = create_engine(sqlite_url(path), connect_args={"check_same_thread": False})
+
+    # pysqlite starts transactions lazily and breaks SAVEPOINT handling; let
+    # SQLAlchemy emit BEGIN itself so nested transactions work.
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+class InlineExecutor(Executor):
+    """Run submitted work right away, in the calling thread."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as ex:
+            future.set_exception(ex)
+        return future
+
+
+def run_migrations(path: Path) -> None:
+    alembic_cfg = Config(str(ALEMBIC_INI))
+    alembic_cfg.set_main_option("sqlalchemy.url", sqlite_url(path))
+    engine = create_engine(sqlite_url(path))
     with engine.begin() as connection:
-        run_migrations(connection)
+        alembic_cfg.attributes["connection"] = connection
+        command.upgrade(alembic_cfg, "head")
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def template_db(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Migrated database file shared by every run with the same schema.
+
+    Without the cache provider (``-p no:cacheprovider``) the template is
+    built once per run in the shared base temporary directory instead.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is not None:
+        cache_dir = cache.mkdir("db-templates")
+    else:
+        # Under xdist, each worker's base temp is a child of the run's.
+        base = tmp_path_factory.getbasetemp()
+        if "PYTEST_XDIST_WORKER" in os.environ:
+            base = base.parent
+        cache_dir = base / "db-templates"
+        cache_dir.mkdir(exist_ok=True)
+    template = cache_dir / f"template-{schema_hash()}.sqlite3"
+
+    if not template.exists():
+        # Several xdist workers may race here: each builds its own file and
+        # atomically moves it in place, so the template is never half-written.
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        partial = cache_dir / f"{template.name}.{worker}.partial"
+        partial.unlink(missing_ok=True)
+        run_migrations(partial)
+        os.replace(partial, template)
+
+    return template
+
+
+@pytest.fixture(scope="session")
+def db_engine(
+    template_db: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Generator[Engine]:
+    """Engine on a private copy of the template, one per xdist worker."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    path = tmp_path_factory.mktemp("db") / f"{worker}.sqlite3"
+    shutil.copyfile(template_db, path)
+
+    engine = create_test_engine(path)
 
     yield engine
 
-    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
 
 
 @pytest.fixture(scope="function")
 def db_session(db_engine: Engine) -> Generator[Session]:
+    """Session whose work is rolled back after each test.
+
+    ``commit()`` and ``rollback()`` inside services only release or roll back
+    a SAVEPOINT, so services behave as in production while the outer
+    transaction keeps tests isolated.
+    """
     connection = db_engine.connect()
     transaction = connection.begin()
-    session = Session(bind=connection)
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     yield session
 
@@ -50,12 +150,86 @@ def db_session(db_engine: Engine) -> Generator[Session]:
     connection.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    rate_limit_backend.reset()
+
+
+@pytest.fixture(scope="function")
+def storage_dir(tmp_path: Path) -> Path:
+    return tmp_path / "storage"
+
+
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(db_session, storage_dir):
     def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_storage_dir] = lambda: storage_dir
+    # Purge jobs run inline on the test session so their work is rolled back
+    # too.
+    app.dependency_overrides[get_session_factory] = lambda: (
+        lambda: contextlib.nullcontext(db_session)
+    )
+    app.dependency_overrides[get_purge_executor] = InlineExecutor
+
+    with TestClient(app) as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def threaded_session_factory(
+    template_db: Path, tmp_path: Path
+) -> Generator[sessionmaker[Session]]:
+    """Sessions on a private copy of the template, configured as in production.
+
+    Nothing is rolled back, so concurrency tests see real transactions and
+    real SQLite locking.
+    """
+    path = tmp_path / "threaded.sqlite3"
+    shutil.copyfile(template_db, path)
+    engine = create_engine(sqlite_url(path), poolclass=MonitoredQueuePool)
+
+    yield sessionmaker(
+        bind=engine,
+        class_=RoutingSession,
+        replicas=ReplicaPool([]),
+        expire_on_commit=False,
+    )
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def purge_executor() -> Generator[ThreadPoolExecutor]:
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    yield executor
+
+    executor.shutdown()
+
+
+@pytest.fixture(scope="function")
+def threaded_client(
+    threaded_session_factory, storage_dir: Path, purge_executor: ThreadPoolExecutor
+):
+    """Client that can be used from several threads at once.
+
+    Every request gets its own session and purge jobs run on
+    ``purge_executor``, as in production.
+    """
+
+    def override_get_db():
+        with threaded_session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_storage_dir] = lambda: storage_dir
+    app.dependency_overrides[get_session_factory] = lambda: threaded_session_factory
+    app.dependency_overrides[get_purge_executor] = lambda: purge_executor
 
     with TestClient(app) as client:
         yield client
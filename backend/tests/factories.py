@@ -0,0 +1,111 @@
+"""Bulk factories for seeding large datasets in tests.
+
+Rows are inserted with a single executemany ``INSERT ... RETURNING`` per
+table, bypassing the ORM unit of work, so seeding thousands of rows takes
+milliseconds. IDs are returned instead of ORM objects; load the few objects
+a test needs through a service.
+
+``add_document`` is the exception: it creates a single document through the
+ORM and writes its files to storage, for tests that read file contents.
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.document import Document, DocumentFile
+from app.models.user import User
+
+
+def _bulk_insert(session: Session, model, rows: list[dict[str, Any]]) -> list[int]:
+    if not rows:
+        return []
+    return list(session.scalars(insert(model).returning(model.id), rows))
+
+
+def create_users(session: Session, count: int, **overrides) -> list[int]:
+    """Insert ``count`` users and return their IDs."""
+    now = datetime.now(UTC)
+    rows = [
+        {
+            "username": f"user{i}",
+            "email": f"user{i}@example.com",
+            "hashed_password": "hashed_pw",
+            "created_at": now,
+            **overrides,
+        }
+        for i in range(count)
+    ]
+    return _bulk_insert(session, User, rows)
+
+
+def create_documents(
+    session: Session,
+    user_ids: list[int],
+    per_user: int,
+    *,
+    files_per_document: int = 0,
+    **overrides,
+) -> list[int]:
+    """Insert ``per_user`` documents for each user and return their IDs.
+
+    Documents get ``files_per_document`` file rows each; the files are not
+    written to storage.
+    """
+    now = datetime.now(UTC)
+    rows = [
+        {
+            "user_id": user_id,
+            "title": f"Document {user_id}-{i}",
+            "created_at": now,
+            **overrides,
+        }
+        for user_id in user_ids
+        for i in range(per_user)
+    ]
+    document_ids = _bulk_insert(session, Document, rows)
+
+    file_rows = [
+        {
+            "document_id": document_id,
+            "path": f"documents/{document_id}/file{i}.pdf",
+            "size": 0,
+            "created_at": now,
+        }
+        for document_id in document_ids
+        for i in range(files_per_document)
+    ]
+    _bulk_insert(session, DocumentFile, file_rows)
+    return document_ids
+
+
+def add_document(
+    session: Session,
+    storage_dir: Path,
+    user_id: int,
+    *,
+    title: str = "Document",
+    content: str | None = None,
+    files: dict[str, bytes] | None = None,
+) -> Document:
+    """Insert a document and write ``files`` (filename to bytes) to storage."""
+    document = Document(user_id=user_id, title=title, content=content)
+    session.add(document)
+    session.flush()
+    for filename, blob in (files or {}).items():
+        path = Path("documents", str(document.id), filename)
+        (storage_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (storage_dir / path).write_bytes(blob)
+        document.files.append(
+            DocumentFile(
+                path=path.as_posix(),
+                size=len(blob),
+                sha256=hashlib.sha256(blob).hexdigest(),
+            )
+        )
+    session.flush()
+    return document
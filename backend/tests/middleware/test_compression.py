@@ -0,0 +1,193 @@
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+LARGE_TEXT = "lorem ipsum dolor sit amet " * 200
+NDJSON_LINES = [f'{{"id": {i}, "username": "user{i}"}}\n' for i in range(2000)]
+
+
+# --- Helpers
+def build_client(**options) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(LARGE_TEXT)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/pdf")
+    def pdf():
+        return Response(LARGE_TEXT.encode(), media_type="application/pdf")
+
+    @app.get("/stream")
+    def stream():
+        lines = (f'{{"line": {i}}}\n' for i in range(100))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    @app.get("/users")
+    def users():
+        return StreamingResponse(NDJSON_LINES, media_type="application/x-ndjson")
+
+    app.add_middleware(CompressionMiddleware, **options)
+    return TestClient(app)
+
+
+def run_streaming_app(
+    lines: list[bytes], *, pause: float, **options
+) -> tuple[bytes, bytes]:
+    """Stream ``lines`` through the middleware, pausing before the last one.
+
+    Returns what the client had decoded before the pause, and everything it
+    decoded.
+    """
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    received: list[bytes] = []
+    decoded_before_pause = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for line in lines[:-1]:
+            await send({"type": "http.response.body", "body": line, "more_body": True})
+        await asyncio.sleep(pause)
+        decoded_before_pause.append(b"".join(received))
+        await send({"type": "http.response.body", "body": lines[-1]})
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            received.append(decoder.decompress(message["body"]))
+
+    async def receive():
+        return {"type": "http.request"}
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    middleware = CompressionMiddleware(app, **options)
+    asyncio.run(middleware(scope, receive, send))
+    return decoded_before_pause[0], b"".join(received)
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return build_client()
+
+
+# --- negotiate_encoding
+def test_negotiate_prefers_server_order_on_ties():
+    assert negotiate_encoding("gzip, br", ["br", "gzip"]) == "br"
+
+
+def test_negotiate_respects_q_values():
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", ["br", "gzip"]) == "gzip"
+
+
+def test_negotiate_skips_rejected_encodings():
+    assert negotiate_encoding("br;q=0, gzip", ["br", "gzip"]) == "gzip"
+
+
+def test_negotiate_supports_wildcard():
+    assert negotiate_encoding("*", ["br", "gzip"]) == "br"
+
+
+def test_negotiate_returns_none_when_nothing_matches():
+    assert negotiate_encoding("deflate", ["br", "gzip"]) is None
+    assert negotiate_encoding("", ["br", "gzip"]) is None
+
+
+# --- CompressionMiddleware
+def test_compresses_large_responses(client: TestClient):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert int(response.headers["Content-Length"]) < len(LARGE_TEXT)
+    assert response.text == LARGE_TEXT
+
+
+def test_skips_responses_below_minimum_size(client: TestClient):
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.text == "ok"
+
+
+def test_skips_when_client_does_not_accept_encoding(client: TestClient):
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_passes_already_compressed_content_through(client: TestClient):
+    response = client.get("/pdf", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.content == LARGE_TEXT.encode()
+
+
+def test_compresses_streaming_responses_incrementally(client: TestClient):
+    with client.stream(
+        "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    lines = gzip.decompress(raw).decode().splitlines()
+    assert lines[0] == '{"line": 0}'
+    assert len(lines) == 100
+
+
+def test_streaming_output_is_not_inflated_by_flushes(client: TestClient):
+    with client.stream(
+        "GET", "/users", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+
+    payload = "".join(NDJSON_LINES).encode()
+    assert gzip.decompress(raw) == payload
+    # Flushing after every line would make the output several times larger.
+    assert len(raw) < 1.2 * len(gzip.compress(payload))
+
+
+def test_streaming_output_is_flushed_once_flush_size_is_buffered():
+    lines = [line.encode() for line in NDJSON_LINES[:100]]
+
+    before_pause, everything = run_streaming_app(
+        lines, pause=0, flush_size=512, flush_interval=60
+    )
+
+    assert len(before_pause) >= 512
+    assert b"".join(lines).startswith(before_pause)
+    assert everything == b"".join(lines)
+
+
+def test_streaming_output_is_flushed_after_flush_interval():
+    lines = [b'{"id": 1}\n', b'{"id": 2}\n', b'{"id": 3}\n']
+
+    before_pause, everything = run_streaming_app(
+        lines, pause=0.2, flush_size=16 * 1024, flush_interval=0.01
+    )
+
+    assert before_pause == b'{"id": 1}\n{"id": 2}\n'
+    assert everything == b"".join(lines)
+
+
+@pytest.mark.parametrize("encoding", ["br", "zstd"])
+def test_compresses_with_brotli_and_zstd(client: TestClient, encoding: str):
+    response = client.get("/large", headers={"Accept-Encoding": encoding})
+
+    assert response.headers["Content-Encoding"] == encoding
+    assert response.text == LARGE_TEXT
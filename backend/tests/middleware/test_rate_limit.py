@@ -0,0 +1,227 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.database import PoolWaitMonitor
+from app.middleware.rate_limit import (
+    AdmissionController,
+    InMemoryRateLimitBackend,
+    RateLimitMiddleware,
+    path_classifier,
+)
+
+
+# --- Helpers
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def request(method: str, path: str) -> Request:
+    return Request({"type": "http", "method": method, "path": path, "headers": []})
+
+
+def acquire(backend: InMemoryRateLimitBackend, key="key", rate=1.0, capacity=2.0):
+    return asyncio.run(backend.acquire(key, rate=rate, capacity=capacity))
+
+
+def build_client(
+    *,
+    backend: InMemoryRateLimitBackend | None = None,
+    admission: AdmissionController | None = None,
+    rate_per_minute: int = 600,
+    burst: int = 100,
+    **options,
+) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/items")
+    def list_items():
+        return []
+
+    @app.post("/items")
+    def create_item():
+        return {}
+
+    @app.get("/exports/{name}")
+    def export(name: str):
+        return {}
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        backend=backend or InMemoryRateLimitBackend(),
+        admission=admission or AdmissionController({"read": 10, "write": 10}),
+        rate_per_minute=rate_per_minute,
+        burst=burst,
+        **options,
+    )
+    return TestClient(app)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+# --- InMemoryRateLimitBackend
+def test_backend_allows_up_to_capacity(clock: FakeClock):
+    backend = InMemoryRateLimitBackend(clock=clock)
+
+    assert acquire(backend) == 0
+    assert acquire(backend) == 0
+    assert acquire(backend) > 0
+
+
+def test_backend_returns_time_until_next_token(clock: FakeClock):
+    backend = InMemoryRateLimitBackend(clock=clock)
+    acquire(backend, rate=0.5, capacity=1)
+
+    assert acquire(backend, rate=0.5, capacity=1) == pytest.approx(2.0)
+
+
+def test_backend_refills_over_time(clock: FakeClock):
+    backend = InMemoryRateLimitBackend(clock=clock)
+    acquire(backend)
+    acquire(backend)
+
+    clock.now = 1.0
+
+    assert acquire(backend) == 0
+
+
+def test_backend_keys_are_independent(clock: FakeClock):
+    backend = InMemoryRateLimitBackend(clock=clock)
+    acquire(backend, key="a", capacity=1)
+
+    assert acquire(backend, key="a", capacity=1) > 0
+    assert acquire(backend, key="b", capacity=1) == 0
+
+
+def test_backend_prunes_full_buckets(clock: FakeClock):
+    backend = InMemoryRateLimitBackend(max_keys=2, clock=clock)
+    acquire(backend, key="a")
+    acquire(backend, key="b")
+
+    clock.now = 10.0
+    acquire(backend, key="c")
+
+    assert set(backend._buckets) == {"c"}
+
+
+# --- AdmissionController
+def test_admission_caps_in_flight_requests():
+    admission = AdmissionController({"read": 1})
+
+    assert admission.try_acquire("read")
+    assert not admission.try_acquire("read")
+
+    admission.release("read")
+
+    assert admission.try_acquire("read")
+
+
+def test_admission_admits_unlimited_classes():
+    admission = AdmissionController({"read": 0})
+
+    assert admission.try_acquire("upload")
+
+
+def test_admission_sheds_load_when_pool_wait_is_high(clock: FakeClock):
+    monitor = PoolWaitMonitor(alpha=1.0, clock=clock)
+    admission = AdmissionController(
+        {"read": 10}, pool_monitor=monitor, pool_wait_threshold=0.1
+    )
+
+    monitor.record(0.5)
+
+    assert not admission.try_acquire("read")
+
+
+def test_admission_recovers_as_pool_wait_decays(clock: FakeClock):
+    monitor = PoolWaitMonitor(alpha=1.0, half_life=1.0, clock=clock)
+    admission = AdmissionController(
+        {"read": 10}, pool_monitor=monitor, pool_wait_threshold=0.1
+    )
+    monitor.record(0.5)
+
+    clock.now = 3.0
+
+    assert admission.try_acquire("read")
+
+
+# --- path_classifier
+def test_path_classifier_matches_whole_path():
+    classify = path_classifier({"upload": r"/uploads/[^/]+/files/[^/]+"})
+
+    assert classify(request("PATCH", "/uploads/abc/files/1")) == "upload"
+    assert classify(request("PATCH", "/uploads/abc/files/1/extra")) == "write"
+
+
+def test_path_classifier_falls_back_to_method():
+    classify = path_classifier({"export": r"/exports/.+"})
+
+    assert classify(request("GET", "/items")) == "read"
+    assert classify(request("POST", "/items")) == "write"
+
+
+# --- RateLimitMiddleware
+def test_middleware_returns_429_with_retry_after():
+    client = build_client(rate_per_minute=60, burst=1)
+    client.get("/items")
+
+    response = client.get("/items")
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert response.json() == {"detail": "Too many requests"}
+
+
+def test_middleware_exempts_health():
+    client = build_client(rate_per_minute=60, burst=1)
+    client.get("/items")
+
+    response = client.get("/health")
+
+    assert response.status_code == 200
+
+
+def test_middleware_returns_503_when_route_class_is_full():
+    admission = AdmissionController({"read": 10, "write": 0})
+    client = build_client(admission=admission)
+
+    assert client.get("/items").status_code == 200
+
+    response = client.post("/items")
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+
+
+def test_middleware_releases_admission_after_response():
+    admission = AdmissionController({"read": 1, "write": 1})
+    client = build_client(admission=admission)
+
+    client.get("/items")
+    client.get("/items")
+
+    assert admission.in_flight("read") == 0
+
+
+def test_middleware_uses_injected_classifier():
+    admission = AdmissionController({"read": 10, "write": 10, "export": 0})
+    client = build_client(
+        admission=admission, classify=path_classifier({"export": r"/exports/.+"})
+    )
+
+    assert client.get("/exports/all").status_code == 503
+    assert client.get("/items").status_code == 200
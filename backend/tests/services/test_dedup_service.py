@@ -0,0 +1,203 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import Session
+
+from app.models.document import DocumentNote, DocumentTag
+from app.models.tag import Tag
+from app.models.user import User
+from app.services.dedup_service import DedupService
+from app.services.minhash import estimate_similarity, minhash_signature
+from app.services.user_service import UserService
+from tests.factories import add_document, create_documents
+
+INVOICE = (
+    "Invoice 2025-114 from Acme Power Ltd. Billing period March 2025. "
+    "Meter reading 48213 kWh. Energy charge 73.20 EUR, standing charge 9.80 EUR, "
+    "VAT 21 percent. Total amount due 100.43 EUR before 15 April 2025."
+)
+
+
+@pytest.fixture
+def service(db_session: Session, storage_dir: Path) -> DedupService:
+    return DedupService(db_session, storage_dir)
+
+
+@pytest.fixture
+def base_user(db_session: Session) -> User:
+    return UserService(db_session).create_user(
+        email="test@example.com",
+        username="testuser",
+        hashed_password="hashed_pw",
+    )
+
+
+# --- MinHash
+def test_minhash_estimates_similarity():
+    first = minhash_signature(INVOICE)
+    second = minhash_signature(INVOICE.replace("100.43", "100.48"))
+    other = minhash_signature("Income tax return for fiscal year 2025")
+
+    assert estimate_similarity(first, second) > 0.7
+    assert estimate_similarity(first, other) < 0.2
+
+
+def test_minhash_returns_none_without_words():
+    assert minhash_signature("  ...  ") is None
+
+
+# --- Find Duplicates
+def test_find_duplicates_detects_identical_blobs(
+    service: DedupService, db_session: Session, storage_dir: Path, base_user: User
+):
+    original = add_document(
+        db_session, storage_dir, base_user.id, files={"a.pdf": b"1"}
+    )
+    copy = add_document(db_session, storage_dir, base_user.id, files={"b.pdf": b"1"})
+
+    assert service.find_duplicates(copy.id) == [(original, 1.0)]
+
+
+def test_find_duplicates_detects_near_duplicate_text(
+    service: DedupService, db_session: Session, storage_dir: Path, base_user: User
+):
+    original = add_document(db_session, storage_dir, base_user.id, content=INVOICE)
+    rescan = add_document(
+        db_session, storage_dir, base_user.id, content=INVOICE.replace("Ltd.", "Ltd")
+    )
+    add_document(
+        db_session, storage_dir, base_user.id, content="Income tax return 2025"
+    )
+    for document in (original, rescan):
+        service.index_document(document.id)
+
+    duplicates = service.find_duplicates(rescan.id)
+
+    assert [duplicate for duplicate, _ in duplicates] == [original]
+    assert duplicates[0][1] >= 0.8
+
+
+def test_find_duplicates_is_scoped_to_user(
+    service: DedupService, db_session: Session, storage_dir: Path, base_user: User
+):
+    other = UserService(db_session).create_user(
+        email="other@example.com", username="other", hashed_password="hashed_pw"
+    )
+    theirs = add_document(
+        db_session, storage_dir, other.id, content=INVOICE, files={"a.pdf": b"1"}
+    )
+    mine = add_document(
+        db_session, storage_dir, base_user.id, content=INVOICE, files={"a.pdf": b"1"}
+    )
+    for document in (theirs, mine):
+        service.index_document(document.id)
+
+    assert service.find_duplicates(mine.id) == []
+
+
+def test_find_duplicates_ignores_unrelated_documents(
+    service: DedupService, db_session: Session, storage_dir: Path, base_user: User
+):
+    create_documents(db_session, [base_user.id], 1_000, files_per_document=2)
+    document = add_document(
+        db_session, storage_dir, base_user.id, content=INVOICE, files={"a": b"1"}
+    )
+    service.index_document(document.id)
+
+    assert service.find_duplicates(document.id) == []
+
+
+def test_find_duplicates_raises_on_not_found(service: DedupService):
+    with pytest.raises(NoResultFound):
+        service.find_duplicates(999)
+
+
+# --- Merge Documents
+def test_merge_documents_moves_files_notes_and_tags(
+    service: DedupService, db_session: Session, storage_dir: Path, base_user: User
+):
+    target = add_document(db_session, storage_dir, base_user.id, files={"a.pdf": b"1"})
+    source = add_document(
+        db_session, storage_dir, base_user.id, files={"a.pdf": b"1", "b.pdf": b"2"}
+    )
+    tag = Tag(name="bills")
+    db_session.add_all(
+        [
+            DocumentNote(document=source, user_id=base_user.id, content="Paid"),
+            DocumentTag(document=source, tag=tag, user_id=base_user.id),
+            DocumentTag(document=target, tag=tag, user_id=base_user.id),
+        ]
+    )
+    db_session.flush()
+    duplicate_blob = storage_dir / source.files[0].path
+
+    merged = service.merge_documents(target.id, source.id)
+
+    assert [file.filename for file in merged.files] == ["a.pdf", "b.pdf"]
+    assert [note.content for note in merged.notes] == ["Paid"]
+    assert len(merged.tags) == 1
+    assert not duplicate_blob.exists()
+    with pytest.raises(NoResultFound):
+        service.find_duplicates(source.id)
+
+
+def test_merge_documents_moves_blobs_into_target_directory(
+    service: DedupService, db_session: Session, storage_dir: Path, base_user: User
+):
+    target = add_document(db_session, storage_dir, base_user.id, files={"a.pdf": b"1"})
+    source = add_document(
+        db_session, storage_dir, base_user.id, files={"a.pdf": b"2", "b.pdf": b"3"}
+    )
+    source_id = source.id
+
+    merged = service.merge_documents(target.id, source.id)
+
+    paths = [file.path for file in merged.files]
+    assert paths == [
+        f"documents/{target.id}/a.pdf",
+        f"documents/{target.id}/a (1).pdf",
+        f"documents/{target.id}/b.pdf",
+    ]
+    assert [(storage_dir / path).read_bytes() for path in paths] == [b"1", b"2", b"3"]
+    assert not (storage_dir / "documents" / str(source_id)).exists()
+
+
+def test_merge_documents_keeps_files_without_hash(
+    service: DedupService, db_session: Session, storage_dir: Path, base_user: User
+):
+    target = add_document(db_session, storage_dir, base_user.id)
+    source = add_document(
+        db_session, storage_dir, base_user.id, files={"a.pdf": b"1", "b.pdf": b"2"}
+    )
+    # Files stored before hashes were computed have none.
+    for file in source.files:
+        file.sha256 = None
+    db_session.flush()
+
+    merged = service.merge_documents(target.id, source.id)
+
+    assert [file.filename for file in merged.files] == ["a.pdf", "b.pdf"]
+    assert all((storage_dir / file.path).exists() for file in merged.files)
+
+
+def test_merge_documents_rejects_same_document(
+    service: DedupService, db_session: Session, storage_dir: Path, base_user: User
+):
+    document = add_document(db_session, storage_dir, base_user.id)
+
+    with pytest.raises(ValueError):
+        service.merge_documents(document.id, document.id)
+
+
+def test_merge_documents_rejects_different_owners(
+    service: DedupService, db_session: Session, storage_dir: Path, base_user: User
+):
+    other = UserService(db_session).create_user(
+        email="other@example.com", username="other", hashed_password="hashed_pw"
+    )
+    mine = add_document(db_session, storage_dir, base_user.id)
+    theirs = add_document(db_session, storage_dir, other.id)
+
+    with pytest.raises(ValueError):
+        service.merge_documents(mine.id, theirs.id)
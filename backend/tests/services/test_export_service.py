@@ -0,0 +1,176 @@
+import io
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import Session
+
+from app.models.document import Document, DocumentNote, DocumentTag
+from app.models.tag import Tag
+from app.models.user import User
+from app.services import export_service
+from app.services.export_service import ExportService, stream_zip
+from app.services.user_service import UserService
+from tests.factories import add_document
+
+
+# --- Helpers
+def read_zip(archive) -> zipfile.ZipFile:
+    return zipfile.ZipFile(io.BytesIO(b"".join(archive)))
+
+
+@pytest.fixture
+def service(db_session: Session, storage_dir: Path) -> ExportService:
+    return ExportService(db_session, storage_dir)
+
+
+@pytest.fixture
+def base_user(db_session: Session) -> User:
+    return UserService(db_session).create_user(
+        email="test@example.com",
+        username="testuser",
+        hashed_password="hashed_pw",
+    )
+
+
+@pytest.fixture
+def document(db_session: Session, storage_dir: Path, base_user: User) -> Document:
+    document = add_document(
+        db_session,
+        storage_dir,
+        base_user.id,
+        title="Tax return",
+        files={"form.pdf": b"%PDF-1.7 " * 100, "notes.txt": b"deductions " * 100},
+    )
+    tag = Tag(name="taxes-2025")
+    db_session.add_all(
+        [
+            tag,
+            DocumentNote(document=document, user_id=base_user.id, content="Filed"),
+            DocumentTag(document=document, tag=tag, user_id=base_user.id),
+        ]
+    )
+    db_session.flush()
+    return document
+
+
+# --- stream_zip
+def test_stream_zip_yields_bounded_pieces(tmp_path: Path):
+    path = tmp_path / "big.bin"
+    path.write_bytes(bytes(range(256)) * 1024)
+
+    pieces = list(stream_zip([("big.bin", path, 256 * 1024)], chunk_size=16 * 1024))
+
+    assert len(pieces) > 10
+    assert max(len(piece) for piece in pieces) <= 17 * 1024
+    assert read_zip(pieces).read("big.bin") == path.read_bytes()
+
+
+def test_stream_zip_reads_open_files(tmp_path: Path):
+    archive = read_zip(stream_zip([("notes.txt", io.BytesIO(b"notes"), 5)]))
+
+    assert archive.read("notes.txt") == b"notes"
+
+
+def test_stream_zip_stores_compressed_formats(tmp_path: Path):
+    (tmp_path / "scan.jpg").write_bytes(b"x" * 1000)
+    (tmp_path / "text.txt").write_bytes(b"x" * 1000)
+
+    archive = read_zip(
+        stream_zip(
+            [
+                ("scan.jpg", tmp_path / "scan.jpg", 1000),
+                ("text.txt", tmp_path / "text.txt", 1000),
+            ]
+        )
+    )
+
+    assert archive.getinfo("scan.jpg").compress_type == zipfile.ZIP_STORED
+    assert archive.getinfo("text.txt").compress_type == zipfile.ZIP_DEFLATED
+    assert archive.testzip() is None
+
+
+# --- Document Archive
+def test_document_archive_contains_files_and_manifest(
+    service: ExportService, document: Document
+):
+    archive = read_zip(service.document_archive(document.id))
+    manifest = json.loads(archive.read("manifest.json"))
+
+    assert sorted(archive.namelist()) == sorted(
+        ["manifest.json", f"{document.id}/form.pdf", f"{document.id}/notes.txt"]
+    )
+    assert archive.read(f"{document.id}/form.pdf") == b"%PDF-1.7 " * 100
+    assert manifest["documents"][0]["title"] == "Tax return"
+    assert manifest["documents"][0]["notes"][0]["content"] == "Filed"
+    assert manifest["documents"][0]["tags"][0]["name"] == "taxes-2025"
+
+
+def test_document_archive_raises_on_not_found(service: ExportService):
+    with pytest.raises(NoResultFound):
+        service.document_archive(999)
+
+
+# --- Tag Archive
+def test_tag_archive_contains_only_tagged_documents(
+    service: ExportService,
+    db_session: Session,
+    storage_dir: Path,
+    base_user: User,
+    document: Document,
+):
+    add_document(
+        db_session, storage_dir, base_user.id, title="Other", files={"a.txt": b"a"}
+    )
+
+    archive = read_zip(service.tag_archive(base_user.id, "taxes-2025"))
+    manifest = json.loads(archive.read("manifest.json"))
+
+    assert [doc["id"] for doc in manifest["documents"]] == [document.id]
+
+
+def test_tag_archive_streams_documents_in_batches(
+    service: ExportService,
+    db_session: Session,
+    storage_dir: Path,
+    base_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(export_service, "EXPORT_BATCH_SIZE", 2)
+    tag = Tag(name="bills")
+    document_ids = []
+    for i in range(5):
+        document = add_document(
+            db_session, storage_dir, base_user.id, files={"bill.pdf": bytes([i])}
+        )
+        db_session.add(DocumentTag(document=document, tag=tag, user_id=base_user.id))
+        document_ids.append(document.id)
+    db_session.flush()
+
+    archive = read_zip(service.tag_archive(base_user.id, "bills"))
+    manifest = json.loads(archive.read("manifest.json"))
+
+    assert archive.namelist()[-1] == "manifest.json"
+    assert [doc["id"] for doc in manifest["documents"]] == document_ids
+    assert [archive.read(f"{i}/bill.pdf") for i in document_ids] == [
+        bytes([i]) for i in range(5)
+    ]
+
+
+def test_tag_archive_is_scoped_to_user(
+    service: ExportService, db_session: Session, document: Document
+):
+    other = UserService(db_session).create_user(
+        email="other@example.com", username="other", hashed_password="hashed_pw"
+    )
+
+    archive = read_zip(service.tag_archive(other.id, "taxes-2025"))
+
+    assert archive.namelist() == ["manifest.json"]
+
+
+def test_tag_archive_raises_on_unknown_tag(service: ExportService, base_user: User):
+    with pytest.raises(NoResultFound):
+        service.tag_archive(base_user.id, "missing")
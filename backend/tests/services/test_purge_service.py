@@ -0,0 +1,277 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import Session
+
+from app.models.document import Document, DocumentFile, DocumentNote, DocumentTag
+from app.models.purge import PurgeJob
+from app.models.tag import Tag
+from app.models.upload import UploadSession
+from app.models.user import User
+from app.services.document_service import DocumentService
+from app.services.purge_service import PurgeService
+from app.services.user_service import UserService
+from tests.factories import create_documents
+
+
+# --- Helpers
+def write_files(db_session: Session, storage_dir: Path, document_ids: list[int]):
+    paths = db_session.execute(
+        select(DocumentFile.path).where(DocumentFile.document_id.in_(document_ids))
+    ).scalars()
+    for path in paths:
+        (storage_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (storage_dir / path).write_bytes(b"blob")
+
+
+def count(db_session: Session, model, *criteria) -> int:
+    return db_session.execute(
+        select(func.count()).select_from(model).where(*criteria)
+    ).scalar_one()
+
+
+@pytest.fixture
+def service(db_session: Session, storage_dir: Path) -> PurgeService:
+    return PurgeService(db_session, storage_dir, batch_size=3)
+
+
+@pytest.fixture
+def base_user(db_session: Session) -> User:
+    return UserService(db_session).create_user(
+        email="test@example.com",
+        username="testuser",
+        hashed_password="hashed_pw",
+    )
+
+
+@pytest.fixture
+def other_user(db_session: Session) -> User:
+    return UserService(db_session).create_user(
+        email="other@example.com",
+        username="other",
+        hashed_password="hashed_pw",
+    )
+
+
+# --- Soft delete
+def test_delete_user_hides_user_and_documents(db_session: Session, base_user: User):
+    document_ids = create_documents(db_session, [base_user.id], 2)
+
+    UserService(db_session).delete_user(base_user.id)
+
+    with pytest.raises(NoResultFound):
+        UserService(db_session).get_user(base_user.id)
+    with pytest.raises(NoResultFound):
+        DocumentService(db_session).get_document(document_ids[0])
+    assert count(db_session, User) == 1
+    assert count(db_session, Document) == 2
+
+
+def test_deleted_user_releases_email_and_username(db_session: Session, base_user: User):
+    user_service = UserService(db_session)
+    user_service.delete_user(base_user.id)
+
+    user = user_service.create_user(
+        email=base_user.email, username=base_user.username, hashed_password="pw"
+    )
+
+    assert user.id != base_user.id
+
+
+# --- create_job
+def test_create_job_counts_documents(
+    service: PurgeService, db_session: Session, base_user: User
+):
+    create_documents(db_session, [base_user.id], 4)
+    UserService(db_session).delete_user(base_user.id)
+
+    job = service.create_job("user", base_user.id)
+
+    assert job.status == "pending"
+    assert job.total == 4
+    assert job.processed == 0
+
+
+def test_create_job_rejects_unknown_entity_type(service: PurgeService):
+    with pytest.raises(ValueError):
+        service.create_job("tag", 1)
+
+
+# --- run
+def test_run_purges_document_in_batches(
+    service: PurgeService, db_session: Session, storage_dir: Path, base_user: User
+):
+    document_id, kept_id = create_documents(
+        db_session, [base_user.id], 2, files_per_document=2
+    )
+    write_files(db_session, storage_dir, [document_id, kept_id])
+    tag = Tag(name="utilities")
+    db_session.add(tag)
+    db_session.flush()
+    db_session.add_all(
+        [
+            DocumentTag(document_id=document_id, tag_id=tag.id, user_id=base_user.id),
+            DocumentNote(document_id=document_id, user_id=base_user.id, content="x"),
+        ]
+    )
+    DocumentService(db_session).delete_document(document_id)
+
+    job = service.run(service.create_job("document", document_id).id)
+
+    assert job.status == "completed"
+    assert (job.total, job.processed) == (1, 1)
+    assert count(db_session, Document) == 1
+    assert count(db_session, DocumentTag) == 0
+    assert count(db_session, DocumentNote) == 0
+    assert not (storage_dir / "documents" / str(document_id)).exists()
+    assert (storage_dir / "documents" / str(kept_id) / "file0.pdf").exists()
+
+
+def test_run_purges_user_and_everything_they_own(
+    service: PurgeService,
+    db_session: Session,
+    storage_dir: Path,
+    base_user: User,
+    other_user: User,
+):
+    user_id = base_user.id
+    document_ids = create_documents(db_session, [user_id], 7, files_per_document=1)
+    (other_document_id,) = create_documents(db_session, [other_user.id], 1)
+    write_files(db_session, storage_dir, document_ids)
+    db_session.add_all(
+        [
+            DocumentNote(document_id=other_document_id, user_id=user_id, content="x"),
+            UploadSession(id="session", user_id=user_id),
+        ]
+    )
+    db_session.flush()
+    (storage_dir / "uploads" / "session").mkdir(parents=True)
+    (storage_dir / "models" / "tags" / str(user_id)).mkdir(parents=True)
+    UserService(db_session).delete_user(user_id)
+
+    job = service.run(service.create_job("user", user_id).id)
+
+    assert job.status == "completed"
+    assert (job.total, job.processed) == (7, 7)
+    assert count(db_session, User, User.id == user_id) == 0
+    assert count(db_session, Document) == 1
+    assert count(db_session, DocumentNote) == 0
+    assert count(db_session, UploadSession) == 0
+    assert list((storage_dir / "documents").iterdir()) == []
+    assert not (storage_dir / "uploads" / "session").exists()
+    assert not (storage_dir / "models" / "tags" / str(user_id)).exists()
+
+
+def test_run_ignores_entities_not_deleted(
+    service: PurgeService, db_session: Session, base_user: User
+):
+    create_documents(db_session, [base_user.id], 2)
+
+    job = service.run(service.create_job("user", base_user.id).id)
+
+    assert job.status == "completed"
+    assert job.processed == 0
+    assert count(db_session, User) == 1
+    assert count(db_session, Document) == 2
+
+
+def test_run_records_failures(
+    service: PurgeService,
+    db_session: Session,
+    base_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    (document_id,) = create_documents(db_session, [base_user.id], 1)
+    DocumentService(db_session).delete_document(document_id)
+    job = service.create_job("document", document_id)
+
+    def fail(document_ids):
+        raise RuntimeError("disk on fire")
+
+    monkeypatch.setattr(service, "_purge_documents", fail)
+    job = service.run(job.id)
+
+    assert job.status == "failed"
+    assert job.error == "disk on fire"
+    assert count(db_session, Document) == 1
+
+
+# --- resume_jobs
+def interrupted_job(
+    service: PurgeService, db_session: Session, user: User, status: str, age: timedelta
+) -> PurgeJob:
+    (document_id,) = create_documents(db_session, [user.id], 1)
+    DocumentService(db_session).delete_document(document_id)
+    job = service.create_job("document", document_id)
+    job.status = status
+    db_session.flush()
+    job.updated_at = datetime.now(UTC) - age
+    db_session.commit()
+    return job
+
+
+@pytest.mark.parametrize("status", ["pending", "running"])
+def test_resume_jobs_runs_abandoned_jobs(
+    service: PurgeService, db_session: Session, base_user: User, status: str
+):
+    job = interrupted_job(service, db_session, base_user, status, timedelta(hours=1))
+
+    resumed = service.resume_jobs(stale_after=timedelta(minutes=10))
+
+    assert [resumed_job.id for resumed_job in resumed] == [job.id]
+    assert service.get_job(job.id).status == "completed"
+    assert count(db_session, Document) == 0
+
+
+def test_resume_jobs_retries_failed_jobs(
+    service: PurgeService, db_session: Session, base_user: User
+):
+    job = interrupted_job(service, db_session, base_user, "failed", timedelta(0))
+
+    service.resume_jobs(stale_after=timedelta(minutes=10))
+
+    assert service.get_job(job.id).status == "completed"
+
+
+def test_resume_jobs_leaves_active_and_finished_jobs(
+    service: PurgeService, db_session: Session, base_user: User
+):
+    interrupted_job(service, db_session, base_user, "running", timedelta(minutes=1))
+    interrupted_job(service, db_session, base_user, "completed", timedelta(hours=1))
+
+    resumed = service.resume_jobs(stale_after=timedelta(minutes=10))
+
+    assert resumed == []
+    assert count(db_session, Document) == 2
+
+
+def test_resume_jobs_skips_jobs_claimed_by_another_runner(
+    service: PurgeService,
+    db_session: Session,
+    base_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    interrupted_job(service, db_session, base_user, "failed", timedelta(0))
+    execute = db_session.execute
+
+    def claim_first(statement, *args, **kwargs):
+        # Another runner takes the job between the lookup and the claim.
+        if statement.is_dml and statement.table.name == "purge_jobs":
+            execute(
+                PurgeJob.__table__.update().values(status="running"), *args, **kwargs
+            )
+        return execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db_session, "execute", claim_first)
+    resumed = service.resume_jobs(stale_after=timedelta(minutes=10))
+
+    assert resumed == []
+    assert count(db_session, Document) == 1
+
+
+def test_get_job_raises_on_not_found(service: PurgeService):
+    with pytest.raises(NoResultFound):
+        service.get_job(999)
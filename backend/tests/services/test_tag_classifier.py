@@ -0,0 +1,132 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.services.tag_classifier import INITIAL_CAPACITY, TagClassifier, hash_features
+
+
+@pytest.fixture
+def classifier(tmp_path: Path) -> TagClassifier:
+    return TagClassifier(tmp_path / "model", n_features=2**10)
+
+
+# --- hash_features
+def test_hash_features_is_normalized():
+    _, values = hash_features("invoice invoice total amount due")
+
+    assert np.linalg.norm(values) == pytest.approx(1.0)
+
+
+def test_hash_features_is_deterministic():
+    first = hash_features("Electricity invoice March")
+    second = hash_features("electricity INVOICE march")
+
+    assert np.array_equal(first[0], second[0])
+    assert np.allclose(first[1], second[1])
+
+
+def test_hash_features_handles_empty_text():
+    indices, values = hash_features("")
+
+    assert indices.size == 0
+    assert values.size == 0
+
+
+# --- TagClassifier
+def test_score_without_model_returns_no_tags(classifier: TagClassifier):
+    tag_ids, scores = classifier.score(["anything"])
+
+    assert tag_ids == []
+    assert scores.shape == (1, 0)
+
+
+def test_learn_and_score_ranks_matching_tag_first(classifier: TagClassifier):
+    classifier.learn(1, "electricity invoice kwh power bill")
+    classifier.learn(2, "income tax return deductions")
+
+    tag_ids, scores = classifier.score(["power invoice for electricity"])
+
+    assert tag_ids == [1, 2]
+    assert scores[0, 0] > scores[0, 1]
+
+
+def test_learn_is_incremental(classifier: TagClassifier):
+    classifier.learn(1, "electricity invoice")
+    _, before = classifier.score(["electricity bill"])
+
+    classifier.learn(1, "electricity bill")
+    _, after = classifier.score(["electricity bill"])
+
+    assert after[0, 0] > before[0, 0]
+
+
+def test_scores_are_cosine_similarities(classifier: TagClassifier):
+    classifier.learn(1, "electricity invoice")
+
+    _, scores = classifier.score(["electricity invoice"])
+
+    assert scores[0, 0] == pytest.approx(1.0, rel=1e-5)
+
+
+def test_score_batch_matches_single_scores(classifier: TagClassifier):
+    classifier.learn(1, "electricity invoice")
+    classifier.learn(2, "tax return")
+    texts = ["electricity", "tax invoice", ""]
+
+    _, batch = classifier.score(texts)
+
+    for row, text in enumerate(texts):
+        _, single = classifier.score([text])
+        assert np.allclose(batch[row], single[0])
+
+
+def test_model_grows_beyond_initial_capacity(classifier: TagClassifier):
+    for tag_id in range(INITIAL_CAPACITY + 1):
+        classifier.learn(tag_id, f"topic{tag_id} words")
+
+    tag_ids, scores = classifier.score([f"topic{INITIAL_CAPACITY} words"])
+
+    assert len(tag_ids) == INITIAL_CAPACITY + 1
+    assert int(np.argmax(scores[0])) == INITIAL_CAPACITY
+
+
+def test_model_is_memory_mappable(classifier: TagClassifier, tmp_path: Path):
+    classifier.learn(1, "electricity invoice")
+
+    weights = np.load(tmp_path / "model" / "weights.npy", mmap_mode="r")
+
+    assert isinstance(weights, np.memmap)
+    assert weights.dtype == np.float32
+
+
+def test_score_while_learning(classifier: TagClassifier):
+    classifier.learn(0, "electricity invoice")
+    done = threading.Event()
+
+    def learn():
+        try:
+            deadline = time.monotonic() + 0.5
+            tag_id = 0
+            while time.monotonic() < deadline:
+                tag_id += 1
+                classifier.learn(tag_id % 20, f"topic{tag_id} electricity invoice")
+        finally:
+            done.set()
+
+    def score():
+        scored = 0
+        while not done.is_set():
+            classifier.score(["electricity invoice"])
+            scored += 1
+        return scored
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        learner = executor.submit(learn)
+        scorers = [executor.submit(score) for _ in range(3)]
+        learner.result()
+
+        assert all(scorer.result() > 0 for scorer in scorers)
@@ -0,0 +1,112 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy.exc import IntegrityError, NoResultFound
+from sqlalchemy.orm import Session
+
+from app.models.document import Document
+from app.models.user import User
+from app.services.tag_service import TagService
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+def service(db_session: Session, storage_dir: Path) -> TagService:
+    return TagService(db_session, storage_dir)
+
+
+@pytest.fixture
+def base_user(db_session: Session) -> User:
+    return UserService(db_session).create_user(
+        email="test@example.com",
+        username="testuser",
+        hashed_password="hashed_pw",
+    )
+
+
+@pytest.fixture
+def documents(db_session: Session, base_user: User) -> list[Document]:
+    documents = [
+        Document(user_id=base_user.id, title="Electricity invoice", content=content)
+        for content in (
+            "kwh power consumption total amount due",
+            "power company invoice kwh meter reading",
+            "annual income tax return deductions",
+        )
+    ]
+    db_session.add_all(documents)
+    db_session.flush()
+    return documents
+
+
+# --- Assign Tag
+def test_assign_tag_creates_tag(service: TagService, documents, base_user: User):
+    document_tag = service.assign_tag(
+        documents[0].id, user_id=base_user.id, name="utilities", color="#00ff00"
+    )
+
+    assert document_tag.tag.name == "utilities"
+    assert document_tag.color == "#00ff00"
+
+
+def test_assign_tag_reuses_existing_tag(
+    service: TagService, documents, base_user: User
+):
+    first = service.assign_tag(documents[0].id, user_id=base_user.id, name="bills")
+    second = service.assign_tag(documents[1].id, user_id=base_user.id, name="bills")
+
+    assert first.tag_id == second.tag_id
+
+
+def test_assign_tag_raises_on_duplicate(service: TagService, documents, base_user):
+    service.assign_tag(documents[0].id, user_id=base_user.id, name="bills")
+
+    with pytest.raises(IntegrityError):
+        service.assign_tag(documents[0].id, user_id=base_user.id, name="bills")
+
+
+def test_assign_tag_raises_on_unknown_document(service: TagService, base_user: User):
+    with pytest.raises(NoResultFound):
+        service.assign_tag(999, user_id=base_user.id, name="bills")
+
+
+# --- Suggest Tags
+def test_suggest_tags_learns_from_assignments(
+    service: TagService, documents, base_user: User
+):
+    service.assign_tag(documents[0].id, user_id=base_user.id, name="utilities")
+    service.assign_tag(documents[2].id, user_id=base_user.id, name="taxes")
+
+    suggestions = service.suggest_tags(documents[1].id, user_id=base_user.id)
+
+    assert suggestions[0][0].name == "utilities"
+
+
+def test_suggest_tags_skips_assigned_tags(
+    service: TagService, documents, base_user: User
+):
+    service.assign_tag(documents[0].id, user_id=base_user.id, name="utilities")
+
+    assert service.suggest_tags(documents[0].id, user_id=base_user.id) == []
+
+
+def test_suggest_tags_is_per_user(
+    service: TagService, db_session: Session, documents, base_user: User
+):
+    other = UserService(db_session).create_user(
+        email="other@example.com", username="other", hashed_password="hashed_pw"
+    )
+    service.assign_tag(documents[0].id, user_id=base_user.id, name="utilities")
+
+    assert service.suggest_tags(documents[1].id, user_id=other.id) == []
+
+
+def test_suggest_tags_batch(service: TagService, documents, base_user: User):
+    service.assign_tag(documents[0].id, user_id=base_user.id, name="utilities")
+
+    suggestions = service.suggest_tags_batch(
+        [documents[1].id, documents[2].id], user_id=base_user.id, min_score=0.3
+    )
+
+    assert [tag.name for tag, _ in suggestions[documents[1].id]] == ["utilities"]
+    assert suggestions[documents[2].id] == []
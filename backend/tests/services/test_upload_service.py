@@ -0,0 +1,335 @@
+import base64
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.upload import UploadSession, UploadSessionFile
+from app.models.user import User
+from app.services.upload_service import (
+    UploadChecksumError,
+    UploadIncompleteError,
+    UploadLengthMismatchError,
+    UploadOffsetMismatchError,
+    UploadService,
+    UploadSizeExceededError,
+)
+from app.services.user_service import UserService
+from tests.factories import create_users
+
+
+def sha256_checksum(data: bytes) -> str:
+    return "sha256 " + base64.b64encode(hashlib.sha256(data).digest()).decode()
+
+
+@pytest.fixture
+def service(db_session: Session, storage_dir: Path) -> UploadService:
+    return UploadService(db_session, storage_dir)
+
+
+@pytest.fixture
+def base_user(db_session: Session) -> User:
+    return UserService(db_session).create_user(
+        email="test@example.com",
+        username="testuser",
+        hashed_password="hashed_pw",
+    )
+
+
+@pytest.fixture
+def upload(service: UploadService, base_user: User) -> UploadSession:
+    return service.create_session(
+        user_id=base_user.id,
+        files=[("page1.pdf", 10), ("page2.pdf", 4)],
+    )
+
+
+# --- Create Session
+def test_create_session_creates_staging_files(
+    service: UploadService, upload: UploadSession, storage_dir: Path
+):
+    staging_dir = storage_dir / "uploads" / upload.id
+
+    assert len(upload.files) == 2
+    assert all(upload_file.offset == 0 for upload_file in upload.files)
+    assert sorted(path.name for path in staging_dir.iterdir()) == sorted(
+        str(upload_file.id) for upload_file in upload.files
+    )
+
+
+def test_create_session_raises_on_unknown_user(service: UploadService):
+    with pytest.raises(NoResultFound):
+        service.create_session(user_id=999, files=[("a.pdf", 1)])
+
+
+@pytest.mark.parametrize("filename", ["../a.pdf", "dir/a.pdf", "..", "a\\b.pdf"])
+def test_create_session_rejects_unsafe_filenames(
+    service: UploadService, base_user: User, filename: str
+):
+    with pytest.raises(ValueError):
+        service.create_session(user_id=base_user.id, files=[(filename, 1)])
+
+
+def test_create_session_rejects_duplicate_filenames(
+    service: UploadService, base_user: User
+):
+    with pytest.raises(ValueError):
+        service.create_session(user_id=base_user.id, files=[("a.pdf", 1), ("a.pdf", 2)])
+
+
+# --- Append Chunk
+def test_append_chunk_advances_offset(service: UploadService, upload: UploadSession):
+    upload_file = upload.files[0]
+
+    updated = service.append_chunk(upload.id, upload_file.id, offset=0, data=b"hello")
+
+    assert updated.offset == 5
+    assert not updated.complete
+
+
+def test_append_chunk_accepts_valid_checksum(
+    service: UploadService, upload: UploadSession
+):
+    upload_file = upload.files[1]
+
+    updated = service.append_chunk(
+        upload.id,
+        upload_file.id,
+        offset=0,
+        data=b"data",
+        checksum=sha256_checksum(b"data"),
+    )
+
+    assert updated.complete
+
+
+def test_append_chunk_raises_on_checksum_mismatch(
+    service: UploadService, upload: UploadSession
+):
+    with pytest.raises(UploadChecksumError):
+        service.append_chunk(
+            upload.id,
+            upload.files[1].id,
+            offset=0,
+            data=b"data",
+            checksum=sha256_checksum(b"other"),
+        )
+
+
+def test_append_chunk_raises_on_unsupported_checksum(
+    service: UploadService, upload: UploadSession
+):
+    with pytest.raises(UploadChecksumError):
+        service.append_chunk(
+            upload.id, upload.files[1].id, offset=0, data=b"data", checksum="crc32 AA=="
+        )
+
+
+def test_append_chunk_raises_on_offset_mismatch(
+    service: UploadService, upload: UploadSession
+):
+    with pytest.raises(UploadOffsetMismatchError):
+        service.append_chunk(upload.id, upload.files[0].id, offset=3, data=b"x")
+
+
+def test_append_chunk_raises_when_exceeding_size(
+    service: UploadService, upload: UploadSession
+):
+    with pytest.raises(UploadSizeExceededError):
+        service.append_chunk(upload.id, upload.files[1].id, offset=0, data=b"12345")
+
+
+def test_append_chunk_raises_on_file_from_other_session(
+    service: UploadService, upload: UploadSession, base_user: User
+):
+    other = service.create_session(user_id=base_user.id, files=[("a.pdf", 1)])
+
+    with pytest.raises(NoResultFound):
+        service.append_chunk(upload.id, other.files[0].id, offset=0, data=b"x")
+
+
+def test_append_chunk_streams_parts(
+    service: UploadService, upload: UploadSession, storage_dir: Path
+):
+    upload_file = upload.files[0]
+
+    updated = service.append_chunk(
+        upload.id,
+        upload_file.id,
+        offset=0,
+        data=iter([b"01", b"234"]),
+        length=5,
+        checksum=sha256_checksum(b"01234"),
+    )
+
+    assert updated.offset == 5
+    staging = storage_dir / "uploads" / upload.id / str(upload_file.id)
+    assert staging.read_bytes() == b"01234"
+
+
+@pytest.mark.parametrize("parts", [[b"12"], [b"12", b"345"]])
+def test_append_chunk_raises_when_stream_does_not_match_length(
+    service: UploadService, upload: UploadSession, storage_dir: Path, parts
+):
+    upload_file = upload.files[0]
+
+    with pytest.raises(UploadLengthMismatchError):
+        service.append_chunk(
+            upload.id, upload_file.id, offset=0, data=iter(parts), length=3
+        )
+
+    assert service.get_session(upload.id).files[0].offset == 0
+    staging = storage_dir / "uploads" / upload.id / str(upload_file.id)
+    assert staging.read_bytes() == b""
+
+
+def test_append_chunk_rolls_back_claim_on_checksum_mismatch(
+    service: UploadService, upload: UploadSession, storage_dir: Path
+):
+    upload_file = upload.files[1]
+
+    with pytest.raises(UploadChecksumError):
+        service.append_chunk(
+            upload.id,
+            upload_file.id,
+            offset=0,
+            data=b"data",
+            checksum=sha256_checksum(b"other"),
+        )
+
+    assert service.get_session(upload.id).files[1].offset == 0
+    staging = storage_dir / "uploads" / upload.id / str(upload_file.id)
+    assert staging.read_bytes() == b""
+
+
+def test_append_chunk_does_not_write_when_range_was_claimed(
+    service: UploadService,
+    upload: UploadSession,
+    db_session: Session,
+    storage_dir: Path,
+):
+    upload_file = upload.files[0]
+    # Another request claimed the range after this one read the offset.
+    db_session.execute(
+        update(UploadSessionFile)
+        .where(UploadSessionFile.id == upload_file.id)
+        .values(offset=3)
+        .execution_options(synchronize_session=False)
+    )
+
+    with pytest.raises(UploadOffsetMismatchError):
+        service.append_chunk(upload.id, upload_file.id, offset=0, data=b"abc")
+
+    staging_dir = storage_dir / "uploads" / upload.id
+    assert (staging_dir / str(upload_file.id)).read_bytes() == b""
+    assert list(staging_dir.glob("*.part")) == []
+
+
+def test_slow_chunk_does_not_block_other_writes(
+    threaded_session_factory: sessionmaker[Session], storage_dir: Path
+):
+    with threaded_session_factory() as session:
+        (user_id,) = create_users(session, 1)
+        session.commit()
+        upload = UploadService(session, storage_dir).create_session(
+            user_id=user_id, files=[("page1.pdf", 6), ("page2.pdf", 3)]
+        )
+    slow_file, other_file = upload.files
+    receiving = threading.Event()
+    release = threading.Event()
+
+    def slow_body():
+        yield b"abc"
+        receiving.set()
+        release.wait(timeout=10)
+        yield b"def"
+
+    def send_slow_chunk():
+        with threaded_session_factory() as session:
+            return UploadService(session, storage_dir).append_chunk(
+                upload.id, slow_file.id, offset=0, data=slow_body(), length=6
+            )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        slow = executor.submit(send_slow_chunk)
+        assert receiving.wait(timeout=10)
+        # While the first chunk is still arriving, other writes go through.
+        try:
+            with threaded_session_factory() as session:
+                other = UploadService(session, storage_dir).append_chunk(
+                    upload.id, other_file.id, offset=0, data=b"xyz"
+                )
+                UserService(session).create_user(
+                    email="new@example.com", username="new", hashed_password="pw"
+                )
+        finally:
+            release.set()
+
+        assert slow.result().offset == 6
+    assert other.offset == 3
+
+
+# --- Finalize
+def test_finalize_creates_document_with_files(
+    service: UploadService, upload: UploadSession, storage_dir: Path
+):
+    first, second = upload.files
+    service.append_chunk(upload.id, first.id, offset=0, data=b"01234")
+    service.append_chunk(upload.id, second.id, offset=0, data=b"abcd")
+    service.append_chunk(upload.id, first.id, offset=5, data=b"56789")
+
+    document = service.finalize(upload.id)
+
+    assert document.title == "page1"
+    assert [file.filename for file in document.files] == ["page1.pdf", "page2.pdf"]
+    assert (storage_dir / document.files[0].path).read_bytes() == b"0123456789"
+    assert (storage_dir / document.files[1].path).read_bytes() == b"abcd"
+    assert not (storage_dir / "uploads" / upload.id).exists()
+
+
+def test_finalize_removes_session(service: UploadService, upload: UploadSession):
+    for upload_file in upload.files:
+        service.append_chunk(
+            upload.id, upload_file.id, offset=0, data=b"x" * upload_file.size
+        )
+
+    service.finalize(upload.id)
+
+    with pytest.raises(NoResultFound):
+        service.get_session(upload.id)
+
+
+def test_finalize_raises_when_incomplete(service: UploadService, upload: UploadSession):
+    with pytest.raises(UploadIncompleteError):
+        service.finalize(upload.id)
+
+
+# --- Abort / Purge
+def test_abort_removes_session_and_staging(
+    service: UploadService, upload: UploadSession, storage_dir: Path
+):
+    service.abort(upload.id)
+
+    with pytest.raises(NoResultFound):
+        service.get_session(upload.id)
+    assert not (storage_dir / "uploads" / upload.id).exists()
+
+
+def test_purge_expired_sessions(
+    service: UploadService, upload: UploadSession, storage_dir: Path
+):
+    upload.updated_at = datetime.now(UTC) - timedelta(days=2)
+
+    assert service.purge_expired_sessions() == 1
+    assert not (storage_dir / "uploads" / upload.id).exists()
+
+
+def test_purge_keeps_active_sessions(service: UploadService, upload: UploadSession):
+    assert service.purge_expired_sessions() == 0
+    assert service.get_session(upload.id) == upload
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.services.user_service import UserService
+from tests.factories import create_users
 
 
 @pytest.fixture
@@ -46,6 +47,14 @@ def test_list_users_returns_multiple_users(service: UserService):
     assert all(user in result for user in users)
 
 
+def test_list_users_returns_large_dataset(service: UserService, db_session: Session):
+    user_ids = create_users(db_session, 5_000)
+
+    result = service.list_users()
+
+    assert [user.id for user in result] == user_ids
+
+
 # --- Get User
 def test_get_user_returns_correct_user(service: UserService, base_user: User):
     user = service.get_user(base_user.id)
@@ -143,6 +152,20 @@ def test_delete_user(service: UserService, base_user: User):
     assert service.list_users() == []
 
 
+# --- Transactions
+def test_rollback_keeps_earlier_commits(
+    service: UserService, db_session: Session, base_user: User
+):
+    with pytest.raises(IntegrityError):
+        service.create_user(
+            email=base_user.email, username="other", hashed_password="hashed_pw"
+        )
+
+    db_session.rollback()
+
+    assert service.list_users() == [base_user]
+
+
 def test_delete_user_raises_on_not_found(service: UserService):
     with pytest.raises(NoResultFound):
         service.delete_user(999)
@@ -0,0 +1,218 @@
+import shutil
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.database import (
+    MonitoredQueuePool,
+    PoolWaitMonitor,
+    ReplicaPool,
+    RoutingSession,
+    get_db,
+)
+from app.models.document import Document, DocumentFile
+from app.models.user import User
+from app.services.document_service import DocumentService
+from app.services.user_service import UserService
+from tests.factories import create_users
+
+
+# --- Helpers
+def add_user(engine: Engine, username: str) -> None:
+    with Session(engine) as session:
+        create_users(session, 1, username=username, email=f"{username}@example.com")
+        session.commit()
+
+
+def usernames(engine: Engine) -> list[str]:
+    with Session(engine) as session:
+        return list(session.scalars(select(User.username).order_by(User.id)))
+
+
+@pytest.fixture
+def engines(template_db: Path, tmp_path: Path) -> Generator[dict[str, Engine]]:
+    """A primary and two replicas, each a separate copy of the template.
+
+    Nothing is replicated between them, which makes it easy to tell which
+    database answered a query.
+    """
+    engines = {}
+    for name in ("primary", "replica1", "replica2"):
+        path = tmp_path / f"{name}.sqlite3"
+        shutil.copyfile(template_db, path)
+        engines[name] = create_engine(f"sqlite:///{path}")
+
+    yield engines
+
+    for engine in engines.values():
+        engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engines: dict[str, Engine]) -> sessionmaker[RoutingSession]:
+    return sessionmaker(
+        bind=engines["primary"],
+        class_=RoutingSession,
+        replicas=ReplicaPool([engines["replica1"], engines["replica2"]]),
+        expire_on_commit=False,
+    )
+
+
+# --- ReplicaPool
+def test_replica_pool_is_round_robin(engines: dict[str, Engine]):
+    pool = ReplicaPool([engines["replica1"], engines["replica2"]])
+
+    picked = [pool.next() for _ in range(4)]
+
+    assert picked == [engines["replica1"], engines["replica2"]] * 2
+
+
+def test_replica_pool_raises_when_empty():
+    with pytest.raises(LookupError):
+        ReplicaPool([]).next()
+
+
+# --- RoutingSession
+def test_read_only_methods_use_a_replica(session_factory, engines):
+    add_user(engines["primary"], "primary")
+    add_user(engines["replica1"], "replica")
+
+    with session_factory() as session:
+        users = UserService(session).list_users()
+
+    assert [user.username for user in users] == ["replica"]
+
+
+def test_sessions_alternate_between_replicas(session_factory, engines):
+    add_user(engines["replica1"], "replica1")
+    add_user(engines["replica2"], "replica2")
+
+    seen = []
+    for _ in range(2):
+        with session_factory() as session:
+            seen += [user.username for user in UserService(session).list_users()]
+
+    assert seen == ["replica1", "replica2"]
+
+
+def test_session_keeps_its_replica(session_factory, engines):
+    add_user(engines["replica1"], "replica1")
+    add_user(engines["replica2"], "replica2")
+
+    with session_factory() as session:
+        service = UserService(session)
+        first = service.list_users()
+        second = service.list_users()
+
+    assert first == second
+
+
+def test_writes_go_to_the_primary(session_factory, engines):
+    with session_factory() as session:
+        UserService(session).create_user(
+            email="new@example.com", username="new", hashed_password="hashed_pw"
+        )
+
+    assert usernames(engines["primary"]) == ["new"]
+    assert usernames(engines["replica1"]) == []
+    assert usernames(engines["replica2"]) == []
+
+
+def test_reads_after_a_write_use_the_primary(session_factory, engines):
+    add_user(engines["replica1"], "replica")
+
+    with session_factory() as session:
+        service = UserService(session)
+        user = service.create_user(
+            email="new@example.com", username="new", hashed_password="hashed_pw"
+        )
+
+        assert service.get_user(user.id) == user
+        assert [user.username for user in service.list_users()] == ["new"]
+
+
+def test_update_reads_from_the_primary(session_factory, engines):
+    add_user(engines["primary"], "primary")
+
+    with session_factory() as session:
+        user = UserService(session).update_user(1, username="renamed")
+
+    assert user.username == "renamed"
+    assert usernames(engines["primary"]) == ["renamed"]
+
+
+def test_without_replicas_reads_use_the_primary(engines):
+    add_user(engines["primary"], "primary")
+    factory = sessionmaker(
+        bind=engines["primary"], class_=RoutingSession, replicas=ReplicaPool([])
+    )
+
+    with factory() as session:
+        users = UserService(session).list_users()
+
+    assert [user.username for user in users] == ["primary"]
+
+
+def test_read_only_methods_load_relationships_from_the_replica(
+    session_factory, engines
+):
+    add_user(engines["replica1"], "replica")
+    with Session(engines["replica1"]) as session:
+        document = Document(user_id=1, title="Scan")
+        document.files.append(DocumentFile(path="documents/1/a.pdf", size=1))
+        session.add(document)
+        session.commit()
+    # The primary has the same document without its file.
+    add_user(engines["primary"], "primary")
+    with Session(engines["primary"]) as session:
+        session.add(Document(user_id=1, title="Scan"))
+        session.commit()
+
+    with session_factory() as session:
+        document = DocumentService(session).get_document(1)
+        filenames = [file.filename for file in document.files]
+
+    assert filenames == ["a.pdf"]
+
+
+# --- Pool wait monitoring
+def test_get_db_does_not_check_out_a_connection():
+    sessions = get_db()
+    session = next(sessions)
+
+    assert not session.in_transaction()
+    sessions.close()
+
+
+def test_monitored_pool_records_checkout_wait(template_db: Path, tmp_path: Path):
+    monitor = PoolWaitMonitor(alpha=1.0, half_life=60.0)
+
+    class Pool(MonitoredQueuePool):
+        pass
+
+    Pool.monitor = monitor
+    path = tmp_path / "pool.sqlite3"
+    shutil.copyfile(template_db, path)
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        poolclass=Pool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    held = engine.connect()
+    # Release the only connection after a while, from another thread.
+    threading.Timer(0.2, held.close).start()
+
+    start = time.perf_counter()
+    with engine.connect():
+        waited = time.perf_counter() - start
+
+    assert monitor.current() == pytest.approx(waited, abs=0.05)
+    assert monitor.current() >= 0.1
+    engine.dispose()